@@ -1,6 +1,7 @@
 """Lesson generator service (wrapper around LangChain)."""
 import json
 import re
+from functools import lru_cache
 from typing import Dict, Any
 from datetime import datetime
 
@@ -12,6 +13,21 @@ from app.services.tts_service import generate_audio
 settings = get_settings()
 
 
+@lru_cache()
+def _get_groq_llm(groq_key: str) -> ChatGroq:
+    """Get a cached Groq chat model.
+
+    Reusing one client keeps its HTTP connection pool alive across lessons, so
+    batch runs (e.g. the evaluation scripts) don't pay a new TLS handshake for
+    every generation.
+    """
+    return ChatGroq(
+        model="openai/gpt-oss-120b",
+        temperature=0.7,
+        groq_api_key=groq_key,
+    )
+
+
 def _parse_duration(duration_value) -> float:
     """Parse duration value to float, handling strings with units."""
     if isinstance(duration_value, (int, float)):
@@ -334,11 +350,7 @@ Generate the lesson now:"""),
             print("[LessonGen] Attempting to use Groq LLM...")
             
 
-            llm = ChatGroq(
-                model="openai/gpt-oss-120b",
-                temperature=0.7,
-                groq_api_key=groq_key,
-            )
+            llm = _get_groq_llm(groq_key)
             llm_name = "groq"
         except Exception as e:
             print(f"[LessonGen] Failed to initialize Groq: {e}")
@@ -398,7 +398,7 @@ async def run_comprehensive_evaluation():
     
     # Full detailed results
     with open(results_dir / f"full_evaluation_{timestamp}.json", "w") as f:
-        json.dump(evaluation_report, f, indent=2)
+        f.write(json.dumps(evaluation_report, indent=2))
     
     # Summary report for quick analysis
     summary_report = {
@@ -408,7 +408,7 @@ async def run_comprehensive_evaluation():
     }
     
     with open(results_dir / f"summary_report_{timestamp}.json", "w") as f:
-        json.dump(summary_report, f, indent=2)
+        f.write(json.dumps(summary_report, indent=2))
     
     # Generate human-readable report
     generate_readable_report(performance_summary, all_validations, results_dir / f"report_{timestamp}.txt")
@@ -6,8 +6,14 @@ Tools for conducting manual pedagogical evaluation and analyzing results.
 """
 
 import json
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Any
 
 
@@ -18,15 +24,15 @@ class ManualReviewAnalyzer:
         """Analyze a completed manual review file."""
         
         try:
-            with open(review_file_path, 'r') as f:
-                review_data = json.load(f)
+            # Decode straight from bytes: one read, and json detects the encoding
+            review_data = json.loads(Path(review_file_path).read_bytes())
         except Exception as e:
             return {"error": f"Failed to load review file: {e}"}
         
         analysis = {
             "analysis_metadata": {
                 "review_file": str(review_file_path),
-                "analysis_date": datetime.utcnow().isoformat(),
+                "analysis_date": datetime.now(timezone.utc).isoformat(timespec='seconds'),
                 "content_type": review_data.get("review_metadata", {}).get("content_type", "unknown")
             },
             "completion_stats": {},
@@ -36,88 +42,81 @@ class ManualReviewAnalyzer:
         }
         
         items = review_data.get("items_for_review", [])
-        completed_items = []
-        
-        # Check completion status
-        for item in items:
-            scores = item.get("manual_scores", {})
-            overall = item.get("overall_assessment", {})
-            
-            # Count completed dimensions
-            completed_dimensions = sum(1 for dim_data in scores.values() 
-                                    if dim_data.get("score") is not None)
-            
-            has_overall_score = overall.get("overall_score") is not None
-            
-            if completed_dimensions > 0 or has_overall_score:
-                completed_items.append(item)
-        
-        analysis["completion_stats"] = {
-            "total_items": len(items),
-            "completed_items": len(completed_items),
-            "completion_rate": len(completed_items) / len(items) * 100 if items else 0
-        }
-        
-        if not completed_items:
-            analysis["insights"].append("No completed reviews found - manual review needed")
-            return analysis
-        
-        # Analyze scores by rubric dimension
-        rubric_dimensions = set()
-        for item in completed_items:
-            rubric_dimensions.update(item.get("manual_scores", {}).keys())
+        completed_count = 0
         
         dimension_scores = {}
         overall_scores = []
         confidence_scores = []
         review_times = []
         
-        for item in completed_items:
-            # Overall scores
-            overall_score = item.get("overall_assessment", {}).get("overall_score")
+        # Detect completion and collect scores in a single pass over the items
+        for item in items:
+            scores = item.get("manual_scores") or {}
+            overall = item.get("overall_assessment") or {}
+            
+            item_scores = []
+            item_confidences = []
+            for dim, dim_data in scores.items():
+                score = dim_data.get("score")
+                if score is not None:
+                    item_scores.append((dim, score))
+                
+                confidence = dim_data.get("confidence")
+                if confidence is not None:
+                    item_confidences.append(confidence)
+            
+            overall_score = overall.get("overall_score")
+            if not item_scores and overall_score is None:
+                continue
+            
+            completed_count += 1
+            
             if overall_score is not None:
                 overall_scores.append(overall_score)
             
-            # Review time
-            review_time = item.get("overall_assessment", {}).get("time_spent_minutes")
+            review_time = overall.get("time_spent_minutes")
             if review_time is not None:
                 review_times.append(review_time)
             
-            # Dimension scores
-            for dim in rubric_dimensions:
-                if dim in item.get("manual_scores", {}):
-                    dim_data = item["manual_scores"][dim]
-                    score = dim_data.get("score")
-                    confidence = dim_data.get("confidence")
-                    
-                    if score is not None:
-                        if dim not in dimension_scores:
-                            dimension_scores[dim] = []
-                        dimension_scores[dim].append(score)
-                    
-                    if confidence is not None:
-                        confidence_scores.append(confidence)
+            for dim, score in item_scores:
+                dimension_scores.setdefault(dim, []).append(score)
+            confidence_scores.extend(item_confidences)
+        
+        analysis["completion_stats"] = {
+            "total_items": len(items),
+            "completed_items": completed_count,
+            "completion_rate": completed_count / len(items) * 100 if items else 0
+        }
         
-        # Calculate statistics
-        import statistics
+        if not completed_count:
+            analysis["insights"].append("No completed reviews found - manual review needed")
+            return analysis
         
+        # Calculate statistics (each mean is computed once and reused for the
+        # standard deviation; the distribution is a single counting pass)
+        overall_mean = None
         if overall_scores:
+            overall_mean = statistics.fmean(overall_scores)
+            overall_counts = Counter(overall_scores)
             analysis["score_analysis"]["overall"] = {
-                "mean": statistics.mean(overall_scores),
+                "mean": overall_mean,
                 "median": statistics.median(overall_scores),
-                "std_dev": statistics.stdev(overall_scores) if len(overall_scores) > 1 else 0,
+                "std_dev": statistics.stdev(overall_scores, overall_mean) if len(overall_scores) > 1 else 0,
                 "min": min(overall_scores),
                 "max": max(overall_scores),
-                "distribution": {i: overall_scores.count(i) for i in range(1, 6)}
+                "distribution": {i: overall_counts.get(i, 0) for i in range(1, 6)}
             }
         
         analysis["score_analysis"]["dimensions"] = {}
+        dim_means = []
         for dim, scores in dimension_scores.items():
             if scores:
+                dim_mean = statistics.fmean(scores)
+                dim_means.append(dim_mean)
                 analysis["score_analysis"]["dimensions"][dim] = {
-                    "mean": statistics.mean(scores),
+                    "mean": dim_mean,
                     "median": statistics.median(scores),
-                    "std_dev": statistics.stdev(scores) if len(scores) > 1 else 0,
+                    "std_dev": statistics.stdev(scores, dim_mean) if len(scores) > 1 else 0,
                     "count": len(scores)
                 }
         
@@ -136,8 +135,8 @@ class ManualReviewAnalyzer:
             }
         
         # Generate insights
-        if overall_scores:
-            avg_score = statistics.mean(overall_scores)
+        if overall_mean is not None:
+            avg_score = overall_mean
             if avg_score >= 4.0:
                 analysis["insights"].append("High quality content - scores consistently above 4.0")
             elif avg_score >= 3.0:
@@ -146,8 +145,7 @@ class ManualReviewAnalyzer:
                 analysis["insights"].append("Quality concerns - scores below 3.0 indicate issues")
         
         # Check dimension score consistency
-        if len(dimension_scores) >= 2:
-            dim_means = [statistics.mean(scores) for scores in dimension_scores.values()]
+        if len(dim_means) >= 2:
             if max(dim_means) - min(dim_means) > 1.0:
                 analysis["insights"].append("Inconsistent quality across dimensions - some areas need improvement")
         
@@ -156,132 +154,155 @@ class ManualReviewAnalyzer:
     def generate_manual_review_report(self, analysis: Dict[str, Any], output_path: Path):
         """Generate a human-readable manual review report."""
         
-        with open(output_path, 'w') as f:
-            f.write("MANUAL REVIEW ANALYSIS REPORT\n")
-            f.write("=" * 35 + "\n\n")
-            
-            metadata = analysis["analysis_metadata"]
-            f.write(f"Analysis Date: {datetime.fromisoformat(metadata['analysis_date']).strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Content Type: {metadata['content_type'].title()}\n")
-            f.write(f"Review File: {metadata['review_file']}\n\n")
-            
-            # Completion statistics
-            f.write("COMPLETION STATISTICS\n")
-            f.write("-" * 20 + "\n")
-            
-            completion = analysis["completion_stats"]
-            f.write(f"Total Items: {completion['total_items']}\n")
-            f.write(f"Completed Items: {completion['completed_items']}\n") 
-            f.write(f"Completion Rate: {completion['completion_rate']:.1f}%\n\n")
+        parts: List[str] = []
+        append = parts.append
+        
+        append("MANUAL REVIEW ANALYSIS REPORT\n")
+        append("=" * 35 + "\n\n")
+        
+        metadata = analysis["analysis_metadata"]
+        append(f"Analysis Date: {datetime.fromisoformat(metadata['analysis_date']).strftime('%Y-%m-%d %H:%M:%S')}\n")
+        append(f"Content Type: {metadata['content_type'].title()}\n")
+        append(f"Review File: {metadata['review_file']}\n\n")
+        
+        # Completion statistics
+        append("COMPLETION STATISTICS\n")
+        append("-" * 20 + "\n")
+        
+        completion = analysis["completion_stats"]
+        append(f"Total Items: {completion['total_items']}\n")
+        append(f"Completed Items: {completion['completed_items']}\n") 
+        append(f"Completion Rate: {completion['completion_rate']:.1f}%\n\n")
+        
+        # Score analysis
+        if "overall" in analysis["score_analysis"]:
+            append("OVERALL SCORE ANALYSIS\n")
+            append("-" * 22 + "\n")
             
-            # Score analysis
-            if "overall" in analysis["score_analysis"]:
-                f.write("OVERALL SCORE ANALYSIS\n")
-                f.write("-" * 22 + "\n")
-                
-                overall = analysis["score_analysis"]["overall"]
-                f.write(f"Mean Score: {overall['mean']:.2f}/5.0\n")
-                f.write(f"Median Score: {overall['median']:.1f}/5.0\n")
-                f.write(f"Standard Deviation: {overall['std_dev']:.2f}\n")
-                f.write(f"Score Range: {overall['min']}-{overall['max']}\n")
-                
-                f.write(f"\nScore Distribution:\n")
-                for score, count in overall['distribution'].items():
-                    f.write(f"  {score}/5: {count} items\n")
-                f.write("\n")
+            overall = analysis["score_analysis"]["overall"]
+            append(f"Mean Score: {overall['mean']:.2f}/5.0\n")
+            append(f"Median Score: {overall['median']:.1f}/5.0\n")
+            append(f"Standard Deviation: {overall['std_dev']:.2f}\n")
+            append(f"Score Range: {overall['min']}-{overall['max']}\n")
             
-            # Dimension analysis
-            if analysis["score_analysis"]["dimensions"]:
-                f.write("RUBRIC DIMENSION ANALYSIS\n")
-                f.write("-" * 25 + "\n")
-                
-                for dim, stats in analysis["score_analysis"]["dimensions"].items():
-                    f.write(f"{dim.replace('_', ' ').title()}: {stats['mean']:.2f}/5.0 ")
-                    f.write(f"(σ={stats['std_dev']:.2f}, n={stats['count']})\n")
-                f.write("\n")
+            append(f"\nScore Distribution:\n")
+            for score, count in overall['distribution'].items():
+                append(f"  {score}/5: {count} items\n")
+            append("\n")
+        
+        # Dimension analysis
+        if analysis["score_analysis"]["dimensions"]:
+            append("RUBRIC DIMENSION ANALYSIS\n")
+            append("-" * 25 + "\n")
             
-            # Reliability metrics
-            if analysis["reliability_metrics"]:
-                f.write("RELIABILITY METRICS\n")
-                f.write("-" * 18 + "\n")
-                
-                if "confidence" in analysis["reliability_metrics"]:
-                    conf = analysis["reliability_metrics"]["confidence"]
-                    f.write(f"Mean Reviewer Confidence: {conf['mean']:.2f}/5.0\n")
-                    f.write(f"Low Confidence Reviews: {conf['low_confidence_count']}\n")
-                
-                if "review_time" in analysis["reliability_metrics"]:
-                    time_stats = analysis["reliability_metrics"]["review_time"]
-                    f.write(f"Mean Review Time: {time_stats['mean_minutes']:.1f} minutes\n")
-                    f.write(f"Total Review Time: {time_stats['total_hours']:.1f} hours\n")
-                
-                f.write("\n")
+            dimensions = analysis["score_analysis"]["dimensions"]
+            pretty = {dim: dim.replace('_', ' ').title() for dim in dimensions}
+            for dim, stats in dimensions.items():
+                append(f"{pretty[dim]}: {stats['mean']:.2f}/5.0 (σ={stats['std_dev']:.2f}, n={stats['count']})\n")
+            append("\n")
+        
+        # Reliability metrics
+        if analysis["reliability_metrics"]:
+            append("RELIABILITY METRICS\n")
+            append("-" * 18 + "\n")
             
-            # Key insights
-            f.write("KEY INSIGHTS\n")
-            f.write("-" * 12 + "\n")
+            if "confidence" in analysis["reliability_metrics"]:
+                conf = analysis["reliability_metrics"]["confidence"]
+                append(f"Mean Reviewer Confidence: {conf['mean']:.2f}/5.0\n")
+                append(f"Low Confidence Reviews: {conf['low_confidence_count']}\n")
             
-            for i, insight in enumerate(analysis["insights"], 1):
-                f.write(f"{i}. {insight}\n")
+            if "review_time" in analysis["reliability_metrics"]:
+                time_stats = analysis["reliability_metrics"]["review_time"]
+                append(f"Mean Review Time: {time_stats['mean_minutes']:.1f} minutes\n")
+                append(f"Total Review Time: {time_stats['total_hours']:.1f} hours\n")
             
-            if not analysis["insights"]:
-                f.write("No specific insights generated - review completion needed\n")
+            append("\n")
+        
+        # Key insights
+        append("KEY INSIGHTS\n")
+        append("-" * 12 + "\n")
+        
+        for i, insight in enumerate(analysis["insights"], 1):
+            append(f"{i}. {insight}\n")
+        
+        if not analysis["insights"]:
+            append("No specific insights generated - review completion needed\n")
+        
+        Path(output_path).write_text(''.join(parts), encoding='utf-8')
 
 
-def create_empty_manual_review_template(content_type: str, topics: List[str], output_dir: Path):
-    """Create an empty manual review template for specified topics."""
+@lru_cache()
+def _get_reviewer():
+    """Import and build the manual review interface on first use.
+    
+    ``pedagogical_evaluation`` loads the quiz/flashcard generators and LLM
+    clients, so it is deferred until a template is actually created.
+    """
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../'))
+    from pedagogical_evaluation import ManualReviewInterface
+    return ManualReviewInterface()
+
+
+def _build_quiz_item(i: int, topic: str) -> Dict[str, Any]:
+    """Build a placeholder quiz item for a review template."""
+    return {
+        "quiz_id": i + 1,
+        "generation_params": {
+            "topic": topic,
+            "user_interest": "technology",
+            "proficiency_level": "intermediate",
+            "grade_level": "high school"
+        },
+        "quiz_data": {
+            "topic": topic,
+            "questions": [{
+                "id": 1,
+                "question": f"Sample question about {topic}",
+                "options": ["Option A", "Option B", "Option C", "Option D"],
+                "correctAnswer": 0,
+                "explanation": "Sample explanation"
+            }]
+        }
+    }
+
+
+def _build_flashcard_item(i: int, topic: str) -> Dict[str, Any]:
+    """Build a placeholder flashcard set for a review template."""
+    return {
+        "flashcard_set_id": i + 1,
+        "generation_params": {
+            "topic": topic,
+            "user_interest": "science",
+            "proficiency_level": "beginner",
+            "grade_level": "middle school"
+        },
+        "flashcard_data": {
+            "topic": topic,
+            "flashcards": [
+                {"front": f"What is {topic}?", "back": f"Sample definition of {topic}"},
+                {"front": f"Key application of {topic}", "back": "Sample application"}
+            ]
+        }
+    }
+
+
+def create_empty_manual_review_template(content_type: str, topics: List[str], output_dir: Path,
+                                        pretty: bool = True):
+    """Create an empty manual review template for specified topics.
+    
+    Pass ``pretty=False`` when the template is consumed by tooling rather than
+    edited by hand; it is then written as compact JSON.
+    """
     
     output_dir.mkdir(exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     
     # Create sample items based on content type
-    sample_items = []
-    
-    for i, topic in enumerate(topics[:10]):  # Limit to 10 items
-        if content_type == "quiz":
-            sample_items.append({
-                "quiz_id": i + 1,
-                "generation_params": {
-                    "topic": topic,
-                    "user_interest": "technology",
-                    "proficiency_level": "intermediate",
-                    "grade_level": "high school"
-                },
-                "quiz_data": {
-                    "topic": topic,
-                    "questions": [{
-                        "id": 1,
-                        "question": f"Sample question about {topic}",
-                        "options": ["Option A", "Option B", "Option C", "Option D"],
-                        "correctAnswer": 0,
-                        "explanation": "Sample explanation"
-                    }]
-                }
-            })
-        else:  # flashcard
-            sample_items.append({
-                "flashcard_set_id": i + 1,
-                "generation_params": {
-                    "topic": topic,
-                    "user_interest": "science",
-                    "proficiency_level": "beginner",
-                    "grade_level": "middle school"
-                },
-                "flashcard_data": {
-                    "topic": topic,
-                    "flashcards": [
-                        {"front": f"What is {topic}?", "back": f"Sample definition of {topic}"},
-                        {"front": f"Key application of {topic}", "back": "Sample application"}
-                    ]
-                }
-            })
+    build = _build_quiz_item if content_type == "quiz" else _build_flashcard_item
+    sample_items = [build(i, topic) for i, topic in enumerate(topics[:10])]  # Limit to 10 items
     
     # Create manual review interface
-    import sys
-    import os
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../'))
-    from pedagogical_evaluation import ManualReviewInterface
-    reviewer = ManualReviewInterface()
+    reviewer = _get_reviewer()
     
     template = reviewer.generate_review_template(content_type, sample_items)
     
@@ -289,8 +310,10 @@ def create_empty_manual_review_template(content_type: str, topics: List[str], ou
     filename = f"manual_review_{content_type}_template_{timestamp}.json"
     filepath = output_dir / filename
     
-    with open(filepath, 'w') as f:
-        json.dump(template, f, indent=2)
+    if pretty:
+        filepath.write_text(json.dumps(template, indent=2))
+    else:
+        filepath.write_text(json.dumps(template, separators=(",", ":")))
     
     print(f"✅ Created manual review template: {filepath}")
     print(f"   Content Type: {content_type.title()}")
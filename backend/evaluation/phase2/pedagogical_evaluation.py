@@ -7,10 +7,13 @@ Research validation without human studies - uses GPT-4/Claude for content evalua
 """
 
 import asyncio
+import gzip
+import hashlib
 import json
 import statistics
-from datetime import datetime
-from typing import Dict, List, Any, Tuple
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import sys
 import os
@@ -20,12 +23,26 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../'))
 
 from app.services.quiz_generator import generate_quiz
 from app.services.flashcard_generator import generate_flashcards
+from groq import APIConnectionError, BadRequestError, RateLimitError
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_groq import ChatGroq
 from app.core.config import get_settings
+from pydantic import BaseModel, Field, ValidationError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; results are written with stdlib json without it
+    orjson = None
 
 settings = get_settings()
 
+# Concurrent generate+judge pipelines; keeps the Groq endpoint busy without
+# tripping its rate limit.
+MAX_CONCURRENT_LLM_CALLS = 8
+
 
 class PedagogicalRubric:
     """Standardized rubrics for educational content evaluation."""
@@ -137,81 +154,89 @@ class PedagogicalRubric:
     }
 
 
-class LLMJudge:
-    """LLM-powered evaluation of educational content quality."""
-    
-    def __init__(self):
-        self.llm = None
-        self.setup_llm()
+def _iso_now() -> str:
+    """Current UTC time as an ISO-8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+JUDGE_MODEL = "llama3-groq-70b-8192-tool-use-preview"
+
+# Bump whenever the rubric or judge prompts change so cached verdicts from the
+# old rubric are not reused.
+RUBRIC_VERSION = 4
+
+# Judge verdicts keyed by (model, rubric version, content hash); reruns over
+# identical content skip the LLM call. Kept with the results rather than the
+# sources; set JUDGE_CACHE=0 to always call the judge (e.g. to measure judge
+# variance) or JUDGE_CACHE_DIR to move it.
+JUDGE_CACHE_DIR = Path(os.getenv(
+    "JUDGE_CACHE_DIR",
+    Path(__file__).resolve().parents[2] / "evaluation_results" / "phase2" / ".judge_cache"
+))
+JUDGE_CACHE_ENABLED = os.getenv("JUDGE_CACHE", "1") != "0"
+
+# Fields that vary between otherwise identical content and must not affect
+# the verdict cache key.
+_VOLATILE_CACHE_FIELDS = frozenset({
+    "id", "quiz_id", "flashcard_set_id", "timestamp", "generated_at",
+    "created_at", "evaluation_timestamp"
+})
+
+
+def _normalize_for_cache(value: Any) -> Any:
+    """Reduce content to a canonical form for the verdict cache.
     
-    def setup_llm(self):
-        """Initialize LLM for evaluation.""" 
-        groq_key = settings.groq_api_key
-        if groq_key:
-            try:
-                self.llm = ChatGroq(
-                    model="llama3-groq-70b-8192-tool-use-preview",
-                    temperature=0.3,  # Lower temperature for more consistent evaluation
-                    groq_api_key=groq_key,
-                )
-            except Exception as e:
-                print(f"[LLMJudge] Failed to initialize Groq: {e}")
+    Ids and timestamps are dropped and whitespace is collapsed, so
+    quizzes/flashcards that differ only in formatting share a cache entry.
+    Case and punctuation are kept since both carry meaning in STEM content
+    ("mA" vs "MA", "CO" vs "Co", formulas).
+    """
+    if isinstance(value, dict):
+        return {
+            k: _normalize_for_cache(v)
+            for k, v in value.items()
+            if k not in _VOLATILE_CACHE_FIELDS
+        }
+    if isinstance(value, list):
+        return [_normalize_for_cache(v) for v in value]
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return value
+
+
+# Quiz questions scored per judge call. Larger batches amortise the prompt
+# better but reply latency grows with batch size.
+QUIZ_QUESTIONS_PER_PROMPT = 5
+
+# Rubric dimension names, taken once from the rubric definitions
+QUIZ_RUBRIC_DIMENSIONS = tuple(PedagogicalRubric.QUIZ_RUBRIC)
+FLASHCARD_RUBRIC_DIMENSIONS = tuple(PedagogicalRubric.FLASHCARD_RUBRIC)
+
+
+def _brief_rubric(rubric: Dict[str, Dict[str, Any]]) -> str:
+    """Render a rubric as one line per dimension for the judge prompt.
     
-    async def evaluate_quiz(self, quiz_data: Dict[str, Any], rubric_category: str = "all") -> Dict[str, Any]:
-        """Evaluate a quiz using LLM-as-judge methodology."""
-        
-        if not self.llm:
-            return {"error": "No LLM available for evaluation"}
-        
-        # Create evaluation prompt
-        evaluation_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an expert educational assessment evaluator. Your task is to critically analyze quiz questions using standardized pedagogical rubrics.
-
-EVALUATION RUBRICS (1-5 scale):
-
-CORRECTNESS (1-5):
-5 = Completely accurate, scientifically precise, no errors
-4 = Mostly accurate, minor imprecision acceptable for level  
-3 = Generally correct, some minor conceptual issues
-2 = Major accuracy issues, but core concept present
-1 = Significant errors, misleading or incorrect information
-
-DISTRACTOR QUALITY (1-5):
-5 = Highly plausible distractors that reveal common misconceptions
-4 = Good distractors, mostly plausible with educational value
-3 = Adequate distractors, some reveal misconceptions
-2 = Weak distractors, too obvious or poorly constructed  
-1 = Poor distractors, clearly wrong or nonsensical
-
-DIFFICULTY APPROPRIATENESS (1-5):
-5 = Perfect difficulty match for specified grade/proficiency level
-4 = Appropriate difficulty, minor calibration issues
-3 = Generally appropriate, some items too hard/easy
-2 = Noticeable difficulty mismatch for target audience
-1 = Severely inappropriate difficulty level
-
-CLARITY (1-5):
-5 = Crystal clear, unambiguous, well-worded questions
-4 = Clear questions with minimal ambiguity
-3 = Generally clear, some minor wording issues
-2 = Some ambiguous or confusing elements
-1 = Confusing, ambiguous, or poorly worded questions
-
-PEDAGOGICAL VALUE (1-5):
-5 = Excellent learning objectives, promotes deep understanding
-4 = Good educational value, supports learning goals
-3 = Adequate pedagogical value, basic learning support  
-2 = Limited educational value, superficial assessment
-1 = Poor pedagogical design, little learning value
-
-EVALUATION REQUIREMENTS:
-- Provide scores for each rubric dimension (1-5)
-- Give specific justifications for each score
-- Identify strengths and areas for improvement
-- Consider the target audience specified
-- Be objective and constructive in feedback
+    The full 1-5 anchors stay in ``PedagogicalRubric`` for human reviewers;
+    the judge only gets the dimension descriptions, which roughly halves the
+    input tokens of every call.
+    """
+    lines = [f"RUBRIC v{RUBRIC_VERSION} (score each dimension 1-5: 5 = excellent, 3 = adequate, 1 = poor):"]
+    lines.extend(f"- {dim.upper()}: {spec['description']}" for dim, spec in rubric.items())
+    return "\n".join(lines)
+
 
+_QUIZ_JUDGE_PREAMBLE = """You are an expert educational assessment evaluator. Your task is to critically analyze quiz questions using standardized pedagogical rubrics.
+
+"""
+
+_QUIZ_RUBRIC_TEXT = _brief_rubric(PedagogicalRubric.QUIZ_RUBRIC) + """
+
+Give a specific justification for each score, identify strengths and areas for improvement, and judge against the target audience specified.
+"""
+
+_QUIZ_SINGLE_OUTPUT_FORMAT = """
 OUTPUT FORMAT:
+Return ONLY a JSON object in this format:
 {{
   "correctness": {{"score": X, "justification": "..."}},
   "distractor_quality": {{"score": X, "justification": "..."}},
@@ -222,9 +247,151 @@ OUTPUT FORMAT:
   "strengths": ["...", "..."],
   "areas_for_improvement": ["...", "..."],
   "recommendation": "..."
-}}"""),
-            
-            ("user", """Evaluate this quiz question:
+}}"""
+
+_QUIZ_BATCH_OUTPUT_FORMAT = """
+OUTPUT FORMAT:
+Return ONLY a JSON object whose "evaluations" array has one object per question, in the order given (Q1 first):
+{{
+  "evaluations": [
+    {{
+      "question_id": 1,
+      "correctness": {{"score": X, "justification": "..."}},
+      "distractor_quality": {{"score": X, "justification": "..."}},
+      "difficulty_appropriateness": {{"score": X, "justification": "..."}},
+      "clarity": {{"score": X, "justification": "..."}},
+      "pedagogical_value": {{"score": X, "justification": "..."}},
+      "overall_score": X.X,
+      "strengths": ["...", "..."],
+      "areas_for_improvement": ["...", "..."],
+      "recommendation": "..."
+    }}
+  ]
+}}"""
+
+
+def _format_quiz_question(question: Dict[str, Any]) -> Dict[str, str]:
+    """Format a generated quiz question into judge prompt fields."""
+    options = question.get("options") or []
+    correct_index = question.get("correctAnswer", question.get("correct_answer", 0))
+    
+    incorrect_opts = [f"- {opt}" for i, opt in enumerate(options) if i != correct_index]
+    
+    if options and isinstance(correct_index, int) and 0 <= correct_index < len(options):
+        correct_answer = options[correct_index]
+    else:
+        correct_answer = "Missing"
+    
+    return {
+        "question_text": question.get("question", "No question text"),
+        "correct_answer": correct_answer,
+        "incorrect_options": "\n".join(incorrect_opts) if incorrect_opts else "No incorrect options",
+        "explanation": question.get("explanation", "No explanation provided")
+    }
+
+
+class RubricScore(BaseModel):
+    """Score and justification for a single rubric dimension."""
+    score: int = Field(..., ge=1, le=5)
+    justification: str = ""
+
+
+class QuizRubricOut(BaseModel):
+    """Judge verdict for one quiz question."""
+    question_id: Optional[int] = None
+    correctness: RubricScore
+    distractor_quality: RubricScore
+    difficulty_appropriateness: RubricScore
+    clarity: RubricScore
+    pedagogical_value: RubricScore
+    overall_score: float = Field(..., ge=1, le=5)
+    strengths: List[str] = []
+    areas_for_improvement: List[str] = []
+    recommendation: str = ""
+
+
+class QuizBatchRubricOut(BaseModel):
+    """Judge verdicts for a batch of quiz questions."""
+    evaluations: List[QuizRubricOut]
+
+
+class FlashcardRubricOut(BaseModel):
+    """Judge verdict for a flashcard set."""
+    content_accuracy: RubricScore
+    cognitive_load: RubricScore
+    memorability: RubricScore
+    contextual_relevance: RubricScore
+    progressive_difficulty: RubricScore
+    overall_score: float = Field(..., ge=1, le=5)
+    strengths: List[str] = []
+    areas_for_improvement: List[str] = []
+    recommendation: str = ""
+
+
+def _combine_question_evaluations(question_evaluations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge per-question verdicts into a single quiz-level evaluation.
+    
+    Rubric and overall scores are averaged across questions; the per-question
+    verdicts are kept under ``question_evaluations``.
+    """
+    result: Dict[str, Any] = {}
+    
+    for dim in QUIZ_RUBRIC_DIMENSIONS:
+        scores = []
+        justifications = []
+        for n, evaluation in enumerate(question_evaluations, 1):
+            dim_data = evaluation.get(dim)
+            if isinstance(dim_data, dict) and isinstance(dim_data.get("score"), (int, float)):
+                scores.append(dim_data["score"])
+                if dim_data.get("justification"):
+                    justifications.append(f"Q{n}: {dim_data['justification']}")
+        if scores:
+            result[dim] = {
+                "score": round(statistics.mean(scores), 2),
+                "justification": " ".join(justifications)
+            }
+    
+    overall_scores = []
+    for evaluation in question_evaluations:
+        try:
+            overall_scores.append(float(evaluation["overall_score"]))
+        except (KeyError, TypeError, ValueError):
+            continue
+    if overall_scores:
+        result["overall_score"] = round(statistics.mean(overall_scores), 2)
+    
+    for key in ("strengths", "areas_for_improvement"):
+        merged = []
+        for evaluation in question_evaluations:
+            for entry in evaluation.get(key) or []:
+                if entry not in merged:
+                    merged.append(entry)
+        result[key] = merged
+    
+    recommendations = [e["recommendation"] for e in question_evaluations if e.get("recommendation")]
+    result["recommendation"] = recommendations[0] if recommendations else ""
+    result["question_evaluations"] = question_evaluations
+    
+    return result
+
+
+# Judge prompts are built once at import rather than on every evaluation
+_QUIZ_BATCH_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _QUIZ_JUDGE_PREAMBLE + _QUIZ_RUBRIC_TEXT + _QUIZ_BATCH_OUTPUT_FORMAT),
+    ("user", """Evaluate these quiz questions:
+
+TOPIC: {topic}
+TARGET AUDIENCE: {grade_level}, {proficiency_level} level
+CONTEXT: Tailored to student interest in {user_interest}
+
+{questions_block}
+
+Please evaluate each of the {question_count} questions against all five rubric dimensions and return the JSON object with one evaluation per question, in order.""")
+])
+
+_QUIZ_SINGLE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", _QUIZ_JUDGE_PREAMBLE + _QUIZ_RUBRIC_TEXT + _QUIZ_SINGLE_OUTPUT_FORMAT),
+    ("user", """Evaluate this quiz question:
 
 TOPIC: {topic}
 TARGET AUDIENCE: {grade_level}, {proficiency_level} level
@@ -239,115 +406,16 @@ INCORRECT OPTIONS:
 
 EXPLANATION: {explanation}
 
-Please evaluate this quiz question against all five rubric dimensions and provide detailed feedback.""")
-        ])
-        
-        try:
-            # Extract quiz question data
-            if "questions" in quiz_data and len(quiz_data["questions"]) > 0:
-                question = quiz_data["questions"][0]  # Evaluate first question
-                
-                # Format incorrect options
-                incorrect_opts = []
-                for i, opt in enumerate(question.get("options", [])):
-                    if i != question.get("correct_answer", 0):
-                        incorrect_opts.append(f"- {opt}")
-                
-                chain = evaluation_prompt | self.llm
-                response = await chain.ainvoke({
-                    "topic": quiz_data.get("topic", "Unknown"),
-                    "grade_level": quiz_data.get("grade_level", "Unknown"),
-                    "proficiency_level": quiz_data.get("proficiency_level", "Unknown"), 
-                    "user_interest": quiz_data.get("tailored_to_interest", "Unknown"),
-                    "question_text": question.get("question", "No question text"),
-                    "correct_answer": question.get("options", ["Missing"])[question.get("correct_answer", 0)] if question.get("options") else "Missing",
-                    "incorrect_options": "\n".join(incorrect_opts) if incorrect_opts else "No incorrect options",
-                    "explanation": question.get("explanation", "No explanation provided")
-                })
-                
-                # Parse response
-                if hasattr(response, "content"):
-                    content = response.content
-                else:
-                    content = response
-                
-                # Try to extract JSON from response
-                if isinstance(content, str):
-                    content = content.strip()
-                    if content.startswith("```json"):
-                        content = content[7:-3]
-                    elif content.startswith("```"):
-                        content = content[3:-3]
-                    
-                    if not content.startswith("{"):
-                        content = "{" + content
-                    
-                    try:
-                        evaluation_result = json.loads(content)
-                        evaluation_result["evaluation_timestamp"] = datetime.utcnow().isoformat()
-                        evaluation_result["evaluator"] = "llm_judge_groq"
-                        return evaluation_result
-                    except json.JSONDecodeError:
-                        return {
-                            "error": "Failed to parse LLM evaluation response",
-                            "raw_response": content[:500]
-                        }
-                
-                return evaluation_result if isinstance(content, dict) else {"error": "Unexpected response format"}
-                
-            else:
-                return {"error": "No questions found in quiz data"}
-                
-        except Exception as e:
-            return {"error": f"LLM evaluation failed: {str(e)}"}
-    
-    async def evaluate_flashcard_set(self, flashcard_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Evaluate flashcards using LLM-as-judge methodology."""
-        
-        if not self.llm:
-            return {"error": "No LLM available for evaluation"}
-        
-        evaluation_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an expert educational content evaluator specializing in flashcard effectiveness. Evaluate flashcard sets using standardized pedagogical rubrics.
-
-FLASHCARD EVALUATION RUBRICS (1-5 scale):
-
-CONTENT ACCURACY (1-5):
-5 = Completely accurate, precise, authoritative content
-4 = Accurate with appropriate level of detail
-3 = Generally accurate, minor oversimplification acceptable
-2 = Some accuracy issues, but concepts mostly correct
-1 = Significant inaccuracies or misleading information
-
-COGNITIVE LOAD (1-5):
-5 = Perfect information chunking, optimal cognitive load
-4 = Good information density, easily digestible  
-3 = Appropriate amount of information, manageable load
-2 = Slightly too much/little information for flashcards
-1 = Poor information density, cognitive overload or underload
-
-MEMORABILITY (1-5):
-5 = Excellent use of memory techniques, highly memorable
-4 = Good memory aids, effective recall strategies
-3 = Some memory support, basic mnemonic value
-2 = Limited memory support, relies mainly on repetition
-1 = Poor memorability, difficult to retain information
-
-CONTEXTUAL RELEVANCE (1-5):
-5 = Excellent real-world connections, highly relevant examples
-4 = Good contextual examples, clear relevance
-3 = Some context provided, adequate real-world links
-2 = Limited contextual relevance, mostly abstract
-1 = No meaningful context, purely theoretical content
-
-PROGRESSIVE DIFFICULTY (1-5):
-5 = Perfect difficulty progression, excellent scaffolding
-4 = Good progression, supports skill building
-3 = Adequate progression, some scaffolding present
-2 = Inconsistent difficulty, limited scaffolding
-1 = Poor progression, difficulty jumps or gaps
+Please evaluate this quiz question against all five rubric dimensions and return the JSON object with detailed feedback.""")
+])
+
+_FLASHCARD_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an expert educational content evaluator specializing in flashcard effectiveness. Evaluate flashcard sets using standardized pedagogical rubrics.
+
+""" + _brief_rubric(PedagogicalRubric.FLASHCARD_RUBRIC) + """
 
 OUTPUT FORMAT:
+Return ONLY a JSON object in this format:
 {{
   "content_accuracy": {{"score": X, "justification": "..."}},
   "cognitive_load": {{"score": X, "justification": "..."}},
@@ -359,8 +427,8 @@ OUTPUT FORMAT:
   "areas_for_improvement": ["...", "..."],
   "recommendation": "..."
 }}"""),
-            
-            ("user", """Evaluate this flashcard set:
+    
+    ("user", """Evaluate this flashcard set:
 
 TOPIC: {topic}
 TARGET AUDIENCE: {grade_level}, {proficiency_level} level
@@ -369,10 +437,239 @@ CONTEXT: Tailored to student interest in {user_interest}
 FLASHCARD SET ({card_count} cards):
 {flashcard_content}
 
-Please evaluate this flashcard set against all five rubric dimensions and provide detailed feedback.""")
-        ])
+Please evaluate this flashcard set against all five rubric dimensions and return the JSON object with detailed feedback.""")
+])
+
+
+def _error_code(error: BadRequestError) -> Optional[str]:
+    """The ``code`` of a Groq API error, from the exception or its response body."""
+    code = getattr(error, "code", None)
+    if code:
+        return code
+    body = getattr(error, "body", None)
+    if not isinstance(body, dict):
+        return None
+    if isinstance(body.get("error"), dict):
+        body = body["error"]
+    return body.get("code")
+
+
+@retry(
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError)),
+    wait=wait_random_exponential(min=1, max=60),
+    stop=stop_after_attempt(6),
+    reraise=True,
+)
+async def _invoke_judge(chain, inputs: Dict[str, Any]) -> Any:
+    """Run a judge chain, backing off on rate limits and dropped connections.
+    
+    In JSON mode Groq rejects a reply that is not valid JSON with a 400
+    (``json_validate_failed``) rather than passing it to the output parser;
+    that case is raised as ``OutputParserException`` so callers treat it as
+    a parse failure. Any other 400 propagates unchanged.
+    """
+    try:
+        return await chain.ainvoke(inputs)
+    except BadRequestError as e:
+        if _error_code(e) == "json_validate_failed":
+            raise OutputParserException(f"Judge reply was not valid JSON: {e}") from e
+        raise
+
+
+class LLMJudge:
+    """LLM-powered evaluation of educational content quality."""
+    
+    def __init__(self, use_cache: bool = JUDGE_CACHE_ENABLED, cache_dir: Optional[Path] = None):
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir) if cache_dir else JUDGE_CACHE_DIR
+        self.llm = None
+        self.quiz_batch_chain = None
+        self.quiz_single_chain = None
+        self.flashcard_chain = None
+        self.setup_llm()
+        
+        if self.llm:
+            # Groq JSON mode guarantees a syntactically valid object; the
+            # pydantic models then check the rubric fields and score ranges.
+            json_llm = self.llm.bind(response_format={"type": "json_object"})
+            self.quiz_batch_chain = (
+                _QUIZ_BATCH_PROMPT | json_llm | JsonOutputParser(pydantic_object=QuizBatchRubricOut)
+            )
+            self.quiz_single_chain = (
+                _QUIZ_SINGLE_PROMPT | json_llm | JsonOutputParser(pydantic_object=QuizRubricOut)
+            )
+            self.flashcard_chain = (
+                _FLASHCARD_PROMPT | json_llm | JsonOutputParser(pydantic_object=FlashcardRubricOut)
+            )
+    
+    def setup_llm(self):
+        """Initialize LLM for evaluation.""" 
+        groq_key = settings.groq_api_key
+        if groq_key:
+            try:
+                self.llm = ChatGroq(
+                    model=JUDGE_MODEL,
+                    temperature=0.3,  # Lower temperature for more consistent evaluation
+                    groq_api_key=groq_key,
+                    max_retries=0,  # _invoke_judge owns retries and backoff
+                )
+            except Exception as e:
+                print(f"[LLMJudge] Failed to initialize Groq: {e}")
+    
+    def _cache_key(self, kind: str, payload: Dict[str, Any]) -> str:
+        """Build the verdict cache key for a piece of content."""
+        key_source = json.dumps(
+            {
+                "model": JUDGE_MODEL,
+                "rubric_v": RUBRIC_VERSION,
+                "kind": kind,
+                "payload": _normalize_for_cache(payload)
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(key_source.encode()).hexdigest()[:32]
+    
+    def _read_verdict(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads((self.cache_dir / f"{key}.json").read_bytes())
+        except (OSError, ValueError):
+            return None
+    
+    def _write_verdict(self, key: str, verdict: Dict[str, Any]):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / f"{key}.json").write_text(json.dumps(verdict))
+        except OSError as e:
+            print(f"[LLMJudge] Failed to cache verdict: {e}")
+    
+    async def _load_cached_verdict(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached verdict, or ``None`` on a miss or with caching off."""
+        if not self.use_cache:
+            return None
+        return await asyncio.to_thread(self._read_verdict, key)
+    
+    async def _store_cached_verdict(self, key: str, verdict: Dict[str, Any]):
+        """Persist a successful verdict for later runs (file I/O off the event loop)."""
+        if self.use_cache:
+            await asyncio.to_thread(self._write_verdict, key, verdict)
+    
+    async def evaluate_quiz(self, quiz_data: Dict[str, Any], rubric_category: str = "all") -> Dict[str, Any]:
+        """Evaluate a quiz using LLM-as-judge methodology.
+        
+        Questions are sent to the judge in batches of up to
+        ``QUIZ_QUESTIONS_PER_PROMPT`` and scored in a single call per batch; a
+        batch whose reply cannot be matched back to its questions is
+        re-evaluated one question at a time.
+        """
+        
+        if not self.llm:
+            return {"error": "No LLM available for evaluation"}
+        
+        try:
+            questions = quiz_data.get("questions") or []
+            if not questions:
+                return {"error": "No questions found in quiz data"}
+            
+            context = {
+                "topic": quiz_data.get("topic", "Unknown"),
+                "grade_level": quiz_data.get("grade_level", "Unknown"),
+                "proficiency_level": quiz_data.get("proficiency_level", "Unknown"), 
+                "user_interest": quiz_data.get("tailored_to_interest", "Unknown"),
+            }
+            
+            cache_key = self._cache_key("quiz", quiz_data)
+            cached = await self._load_cached_verdict(cache_key)
+            if cached is not None:
+                return cached
+            
+            question_evaluations = []
+            for start in range(0, len(questions), QUIZ_QUESTIONS_PER_PROMPT):
+                batch = questions[start:start + QUIZ_QUESTIONS_PER_PROMPT]
+                batch_result = await self._evaluate_question_batch(context, batch)
+                
+                if batch_result is None:
+                    # Fall back to one call per question
+                    batch_result = []
+                    for question in batch:
+                        single_result = await self._evaluate_single_question(context, question)
+                        if "error" in single_result:
+                            return single_result
+                        batch_result.append(single_result)
+                
+                question_evaluations.extend(batch_result)
+            
+            evaluation_result = _combine_question_evaluations(question_evaluations)
+            evaluation_result["evaluation_timestamp"] = _iso_now()
+            evaluation_result["evaluator"] = "llm_judge_groq"
+            await self._store_cached_verdict(cache_key, evaluation_result)
+            return evaluation_result
+                
+        except Exception as e:
+            return {"error": f"LLM evaluation failed: {str(e)}"}
+    
+    async def _evaluate_question_batch(
+        self, context: Dict[str, Any], questions: List[Dict[str, Any]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Score several questions in one judge call.
+        
+        Returns one evaluation per question, or ``None`` if the reply could not
+        be parsed into exactly that many evaluations.
+        """
+        
+        blocks = []
+        for n, question in enumerate(questions, 1):
+            fields = _format_quiz_question(question)
+            blocks.append(
+                f"Q{n}: {fields['question_text']}\n"
+                f"CORRECT ANSWER: {fields['correct_answer']}\n"
+                f"INCORRECT OPTIONS:\n{fields['incorrect_options']}\n"
+                f"EXPLANATION: {fields['explanation']}"
+            )
+        
+        try:
+            parsed = await _invoke_judge(self.quiz_batch_chain, {
+                **context,
+                "questions_block": "\n\n".join(blocks),
+                "question_count": len(questions),
+            })
+            evaluations = QuizBatchRubricOut.model_validate(parsed).evaluations
+        except (OutputParserException, ValidationError):
+            return None
+        
+        if len(evaluations) != len(questions):
+            return None
+        
+        # Order by question id when the judge supplied them
+        if all(item.question_id is not None for item in evaluations):
+            evaluations.sort(key=lambda item: item.question_id)
+        return [item.model_dump() for item in evaluations]
+    
+    async def _evaluate_single_question(
+        self, context: Dict[str, Any], question: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Score one quiz question in its own judge call."""
+        
+        try:
+            parsed = await _invoke_judge(
+                self.quiz_single_chain, {**context, **_format_quiz_question(question)}
+            )
+            return QuizRubricOut.model_validate(parsed).model_dump()
+        except (OutputParserException, ValidationError) as e:
+            return {"error": f"Failed to parse LLM evaluation response: {e}"}
+    
+    async def evaluate_flashcard_set(self, flashcard_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Evaluate flashcards using LLM-as-judge methodology."""
+        
+        if not self.llm:
+            return {"error": "No LLM available for evaluation"}
         
         try:
+            cache_key = self._cache_key("flashcard_set", flashcard_data)
+            cached = await self._load_cached_verdict(cache_key)
+            if cached is not None:
+                return cached
+            
             # Format flashcard content for evaluation
             cards = flashcard_data.get("flashcards", [])
             card_content = []
@@ -383,44 +680,23 @@ Please evaluate this flashcard set against all five rubric dimensions and provid
                 card_content.append(f"  Back: {card.get('back', 'Missing back')}")
                 card_content.append("")
             
-            chain = evaluation_prompt | self.llm
-            response = await chain.ainvoke({
-                "topic": flashcard_data.get("topic", "Unknown"),
-                "grade_level": flashcard_data.get("grade_level", "Unknown"), 
-                "proficiency_level": flashcard_data.get("proficiency_level", "Unknown"),
-                "user_interest": flashcard_data.get("tailored_to_interest", "Unknown"),
-                "card_count": len(cards),
-                "flashcard_content": "\n".join(card_content)
-            })
-            
-            # Parse response (similar to quiz evaluation)
-            if hasattr(response, "content"):
-                content = response.content
-            else:
-                content = response
-            
-            if isinstance(content, str):
-                content = content.strip()
-                if content.startswith("```json"):
-                    content = content[7:-3]
-                elif content.startswith("```"):
-                    content = content[3:-3]
-                
-                if not content.startswith("{"):
-                    content = "{" + content
-                
-                try:
-                    evaluation_result = json.loads(content)
-                    evaluation_result["evaluation_timestamp"] = datetime.utcnow().isoformat()
-                    evaluation_result["evaluator"] = "llm_judge_groq"
-                    return evaluation_result
-                except json.JSONDecodeError:
-                    return {
-                        "error": "Failed to parse LLM evaluation response",
-                        "raw_response": content[:500]
-                    }
+            try:
+                parsed = await _invoke_judge(self.flashcard_chain, {
+                    "topic": flashcard_data.get("topic", "Unknown"),
+                    "grade_level": flashcard_data.get("grade_level", "Unknown"), 
+                    "proficiency_level": flashcard_data.get("proficiency_level", "Unknown"),
+                    "user_interest": flashcard_data.get("tailored_to_interest", "Unknown"),
+                    "card_count": len(cards),
+                    "flashcard_content": "\n".join(card_content)
+                })
+                evaluation_result = FlashcardRubricOut.model_validate(parsed).model_dump()
+            except (OutputParserException, ValidationError) as e:
+                return {"error": f"Failed to parse LLM evaluation response: {e}"}
             
-            return evaluation_result if isinstance(content, dict) else {"error": "Unexpected response format"}
+            evaluation_result["evaluation_timestamp"] = _iso_now()
+            evaluation_result["evaluator"] = "llm_judge_groq"
+            await self._store_cached_verdict(cache_key, evaluation_result)
+            return evaluation_result
             
         except Exception as e:
             return {"error": f"LLM evaluation failed: {str(e)}"}
@@ -435,38 +711,42 @@ class ManualReviewInterface:
     def generate_review_template(self, content_type: str, items: List[Dict]) -> Dict[str, Any]:
         """Generate a review template for manual evaluation."""
         
+        if content_type == "quiz":
+            rubric, rubric_dims = PedagogicalRubric.QUIZ_RUBRIC, QUIZ_RUBRIC_DIMENSIONS
+        else:
+            rubric, rubric_dims = PedagogicalRubric.FLASHCARD_RUBRIC, FLASHCARD_RUBRIC_DIMENSIONS
+        
         template = {
             "review_metadata": {
                 "content_type": content_type,
                 "total_items": len(items),
-                "review_date": datetime.utcnow().isoformat(),
+                "review_date": _iso_now(),
                 "reviewer": "manual_reviewer",
                 "estimated_time": f"{len(items) * 6} minutes"  # 6 min per item average
             },
-            "rubric": PedagogicalRubric.QUIZ_RUBRIC if content_type == "quiz" else PedagogicalRubric.FLASHCARD_RUBRIC,
-            "items_for_review": []
-        }
-        
-        for i, item in enumerate(items):
-            review_item = {
-                "item_id": i + 1,
-                "content": item,
-                "manual_scores": {
-                    rubric_dim: {
-                        "score": None,  # To be filled by reviewer
-                        "notes": "",
-                        "confidence": None  # 1-5 confidence in score
+            "rubric": rubric,
+            "items_for_review": [
+                {
+                    "item_id": i,
+                    "content": item,
+                    "manual_scores": {
+                        rubric_dim: {
+                            "score": None,  # To be filled by reviewer
+                            "notes": "",
+                            "confidence": None  # 1-5 confidence in score
+                        }
+                        for rubric_dim in rubric_dims
+                    },
+                    "overall_assessment": {
+                        "overall_score": None,
+                        "recommendation": "",
+                        "time_spent_minutes": None,
+                        "reviewer_comments": ""
                     }
-                    for rubric_dim in template["rubric"].keys()
-                },
-                "overall_assessment": {
-                    "overall_score": None,
-                    "recommendation": "",
-                    "time_spent_minutes": None,
-                    "reviewer_comments": ""
                 }
-            }
-            template["items_for_review"].append(review_item)
+                for i, item in enumerate(items, 1)
+            ]
+        }
         
         return template
     
@@ -486,49 +766,176 @@ class ManualReviewInterface:
             "reviewer_feedback": []
         }
         
-        # Extract all scores by rubric dimension
-        all_rubric_dims = set()
-        for review in completed_reviews:
-            if "manual_scores" in review:
-                all_rubric_dims.update(review["manual_scores"].keys())
-        
-        for dim in all_rubric_dims:
-            scores = []
-            for review in completed_reviews:
-                if "manual_scores" in review and dim in review["manual_scores"]:
-                    score = review["manual_scores"][dim].get("score")
-                    if score is not None:
-                        scores.append(score)
-            
-            if scores:
-                stats["rubric_scores"][dim] = {
-                    "mean": statistics.mean(scores),
-                    "median": statistics.median(scores),
-                    "std_dev": statistics.stdev(scores) if len(scores) > 1 else 0,
-                    "min": min(scores),
-                    "max": max(scores),
-                    "count": len(scores)
-                }
-        
-        # Overall assessment scores
+        # Collect rubric and overall scores in a single pass over the reviews
+        dim_scores: Dict[str, List[float]] = defaultdict(list)
         overall_scores = []
         for review in completed_reviews:
-            if "overall_assessment" in review:
-                score = review["overall_assessment"].get("overall_score")
+            for dim, dim_data in (review.get("manual_scores") or {}).items():
+                score = dim_data.get("score")
                 if score is not None:
-                    overall_scores.append(score)
+                    dim_scores[dim].append(score)
+            
+            score = (review.get("overall_assessment") or {}).get("overall_score")
+            if score is not None:
+                overall_scores.append(score)
+        
+        for dim, scores in dim_scores.items():
+            mean = statistics.fmean(scores)
+            stats["rubric_scores"][dim] = {
+                "mean": mean,
+                "median": statistics.median(scores),
+                "std_dev": statistics.stdev(scores, mean) if len(scores) > 1 else 0,
+                "min": min(scores),
+                "max": max(scores),
+                "count": len(scores)
+            }
         
         if overall_scores:
+            overall_mean = statistics.fmean(overall_scores)
+            score_counts = Counter(overall_scores)
             stats["overall_scores"] = {
-                "mean": statistics.mean(overall_scores),
+                "mean": overall_mean,
                 "median": statistics.median(overall_scores),
-                "std_dev": statistics.stdev(overall_scores) if len(overall_scores) > 1 else 0,
-                "distribution": {i: overall_scores.count(i) for i in range(1, 6)}
+                "std_dev": statistics.stdev(overall_scores, overall_mean) if len(overall_scores) > 1 else 0,
+                "distribution": {i: score_counts.get(i, 0) for i in range(1, 6)}
             }
         
         return stats
 
 
+def _json_default(value: Any) -> str:
+    """Fallback encoder: ISO-8601 for datetimes (as orjson does), str otherwise."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _json_bytes(obj: Any, pretty: bool = False) -> bytes:
+    """Serialise a results document as UTF-8 JSON.
+    
+    Output is compact unless ``pretty`` is set; only files people edit by
+    hand need indenting. Values JSON has no type for, such as the generators'
+    ``datetime`` metadata, are written as strings.
+    """
+    if orjson is not None:
+        # Rubric criteria are keyed by int score, hence OPT_NON_STR_KEYS
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, default=_json_default, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+class _Welford:
+    """Running count, mean, sample standard deviation, min and max of a score stream.
+    
+    Uses Welford's online update, so scores are summarised in one pass
+    without being stored.
+    """
+    
+    __slots__ = ("n", "mean", "m2", "min", "max")
+    
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+    
+    def add(self, x: float):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+    
+    @property
+    def std_dev(self) -> float:
+        return (self.m2 / (self.n - 1)) ** 0.5 if self.n > 1 else 0.0
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain, JSON-serialisable summary; statistics are None with no scores."""
+        if not self.n:
+            return {"n": 0, "mean": None, "std_dev": None, "min": None, "max": None}
+        return {"n": self.n, "mean": self.mean, "std_dev": self.std_dev, "min": self.min, "max": self.max}
+
+
+def _aggregate_scores(evals: List[Dict[str, Any]], dims: Tuple[str, ...]) -> Dict[str, Any]:
+    """Summarise overall and per-dimension judge scores of successful evaluations.
+    
+    Each score stream is folded into a ``_Welford`` accumulator in a single
+    pass over ``evals``; the summaries
+    are returned as plain dicts with ``n``/``mean``/``std_dev``/``min``/``max``.
+    """
+    overall = _Welford()
+    by_dim = {dim: _Welford() for dim in dims}
+    successful = 0
+    
+    for eval_data in evals:
+        llm_eval = eval_data.get("llm_evaluation", {})
+        if "error" in llm_eval:
+            continue
+        successful += 1
+        
+        score = llm_eval.get("overall_score")
+        if score is not None:
+            overall.add(float(score))
+        
+        for dim in dims:
+            dim_data = llm_eval.get(dim)
+            if dim_data and "score" in dim_data:
+                by_dim[dim].add(float(dim_data["score"]))
+    
+    return {
+        "total": len(evals),
+        "successful": successful,
+        "overall": overall.as_dict(),
+        "by_dim": {dim: acc.as_dict() for dim, acc in by_dim.items()}
+    }
+
+
+def _encode_results(
+    results: Dict[str, Any], template_files: Dict[str, str]
+) -> Tuple[bytes, bytes, bytes]:
+    """Encode the full results and both review templates for saving.
+    
+    The templates are filled in by hand, so they are saved indented in their
+    own files and encoded only once: the full results (machine-read, written
+    compact) record the template filenames from ``template_files`` instead of
+    repeating them. Returns (results, quiz template, flashcard template) bytes.
+    """
+    templates = results["manual_review_templates"]
+    return (
+        _json_bytes({**results, "manual_review_templates": template_files}),
+        _json_bytes(templates["quiz_template"], pretty=True),
+        _json_bytes(templates["flashcard_template"], pretty=True),
+    )
+
+
+def _write_gzip(path: Path, data: bytes):
+    """Write ``data`` gzip-compressed to ``path``."""
+    Path(path).write_bytes(gzip.compress(data, compresslevel=6))
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """Load a saved results file, either ``.json`` or gzip-compressed ``.json.gz``."""
+    data = Path(path).read_bytes()
+    if str(path).endswith(".gz"):
+        data = gzip.decompress(data)
+    return json.loads(data)
+
+
+def _iter_jsonl(path: Path):
+    """Yield the records of a JSONL results file one at a time."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
 async def run_pedagogical_evaluation(
     num_quizzes: int = 20,
     num_flashcard_sets: int = 10,
@@ -556,10 +963,12 @@ async def run_pedagogical_evaluation(
     # Create results directory
     results_dir = Path("../../evaluation_results/phase2")
     results_dir.mkdir(exist_ok=True, parents=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # Phase 2A: Generate and evaluate quizzes
-    print("📝 Phase 2A: Quiz Generation & LLM Evaluation")
-    quiz_evaluations = []
+    # Full records (generated content + verdict) are streamed here as each
+    # item completes, so memory stays bounded and a crash keeps partial results
+    quiz_jsonl_path = results_dir / f"quiz_evaluations_{timestamp}.jsonl"
+    flashcard_jsonl_path = results_dir / f"flashcard_evaluations_{timestamp}.jsonl"
     
     # STEM topics for quiz generation (subset from Phase 1)
     quiz_topics = [
@@ -576,15 +985,24 @@ async def run_pedagogical_evaluation(
     proficiency_levels = ["beginner", "intermediate", "advanced"]
     grade_levels = ["middle school", "high school", "college"]
     
-    print(f"⏳ Generating and evaluating {num_quizzes} quizzes...")
+    # One semaphore shared by both phases so the rate limit, not the phase,
+    # bounds concurrency
+    sem = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+    total_items = num_quizzes + num_flashcard_sets
+    completed = 0
+    
+    def _report_progress(label: str):
+        nonlocal completed
+        completed += 1
+        print(f"\r   {completed}/{total_items} items evaluated ({label}) ", end="", flush=True)
     
-    for i in range(num_quizzes):
+    async def _one_quiz(i: int) -> Dict[str, Any]:
         topic = quiz_topics[i % len(quiz_topics)]
         user_interest = user_interests[i % len(user_interests)]
         proficiency = proficiency_levels[i % len(proficiency_levels)]
         grade = grade_levels[i % len(grade_levels)]
         
-        try:
+        async with sem:
             # Generate quiz
             quiz_data = await generate_quiz(
                 topic=topic,
@@ -594,40 +1012,27 @@ async def run_pedagogical_evaluation(
             
             # Evaluate with LLM judge
             llm_evaluation = await llm_judge.evaluate_quiz(quiz_data)
-            
-            quiz_evaluations.append({
-                "quiz_id": i + 1,
-                "generation_params": {
-                    "topic": topic,
-                    "user_interest": user_interest,
-                    "proficiency_level": proficiency,
-                    "grade_level": grade
-                },
-                "quiz_data": quiz_data,
-                "llm_evaluation": llm_evaluation,
-                "timestamp": datetime.utcnow().isoformat()
-            })
-            
-            print(f"\r   Quiz {i+1}/{num_quizzes}: {topic[:25]}... ", end="", flush=True)
-            
-        except Exception as e:
-            print(f"\n   ❌ Failed to generate/evaluate quiz {i+1}: {e}")
-    
-    print("\n✅ Quiz evaluation completed!")
-    
-    # Phase 2B: Generate and evaluate flashcards
-    print(f"\n🗃️ Phase 2B: Flashcard Generation & LLM Evaluation")
-    flashcard_evaluations = []
-    
-    print(f"⏳ Generating and evaluating {num_flashcard_sets} flashcard sets...")
+        
+        return {
+            "quiz_id": i + 1,
+            "generation_params": {
+                "topic": topic,
+                "user_interest": user_interest,
+                "proficiency_level": proficiency,
+                "grade_level": grade
+            },
+            "quiz_data": quiz_data,
+            "llm_evaluation": llm_evaluation,
+            "timestamp": _iso_now()
+        }
     
-    for i in range(num_flashcard_sets):
+    async def _one_flashcard_set(i: int) -> Dict[str, Any]:
         topic = quiz_topics[i % len(quiz_topics)]
         user_interest = user_interests[i % len(user_interests)]
         proficiency = proficiency_levels[i % len(proficiency_levels)]
         grade = grade_levels[i % len(grade_levels)]
         
-        try:
+        async with sem:
             # Generate flashcards
             flashcard_raw_data = await generate_flashcards(
                 topic=f"{topic} for {proficiency} level {grade} students interested in {user_interest}",
@@ -645,47 +1050,97 @@ async def run_pedagogical_evaluation(
             
             # Evaluate with LLM judge  
             llm_evaluation = await llm_judge.evaluate_flashcard_set(flashcard_data)
-            
-            flashcard_evaluations.append({
-                "flashcard_set_id": i + 1,
-                "generation_params": {
-                    "topic": topic,
-                    "user_interest": user_interest,
-                    "proficiency_level": proficiency,
-                    "grade_level": grade
-                },
-                "flashcard_data": flashcard_data,
-                "llm_evaluation": llm_evaluation,
-                "timestamp": datetime.utcnow().isoformat()
-            })
-            
-            print(f"\r   Flashcard set {i+1}/{num_flashcard_sets}: {topic[:20]}... ", end="", flush=True)
-            
+        
+        return {
+            "flashcard_set_id": i + 1,
+            "generation_params": {
+                "topic": topic,
+                "user_interest": user_interest,
+                "proficiency_level": proficiency,
+                "grade_level": grade
+            },
+            "flashcard_data": flashcard_data,
+            "llm_evaluation": llm_evaluation,
+            "timestamp": _iso_now()
+        }
+    
+    async def _guarded(i: int, worker) -> Tuple[int, Any]:
+        try:
+            return i + 1, await worker(i)
         except Exception as e:
-            print(f"\n   ❌ Failed to generate/evaluate flashcard set {i+1}: {e}")
+            return i + 1, e
+    
+    async def _collect(
+        tasks: List["asyncio.Task"], kind: str, id_key: str, data_key: str, jsonl_path: Path
+    ) -> List[Dict[str, Any]]:
+        # Consume results as they finish so progress and failures show up
+        # immediately rather than in submission order. Each full record goes
+        # straight to the JSONL file; only the verdict is kept in memory.
+        evaluations = []
+        # Unbuffered: each record is one write, so a crash keeps whole lines
+        with open(jsonl_path, "wb", buffering=0) as stream:
+            for fut in asyncio.as_completed(tasks):
+                item_no, result = await fut
+                if isinstance(result, Exception):
+                    print(f"\n   ❌ Failed to generate/evaluate {kind} {item_no}: {result}")
+                else:
+                    try:
+                        stream.write(_json_bytes(result) + b"\n")
+                    except (TypeError, ValueError, OSError) as e:
+                        # The verdict is still kept; only the saved record is lost
+                        print(f"\n   ⚠️  Could not save {kind} {item_no} record: {e}")
+                    evaluations.append({k: v for k, v in result.items() if k != data_key})
+                _report_progress(f"{kind} {item_no}")
+        evaluations.sort(key=lambda e: e[id_key])
+        return evaluations
+    
+    async def _run_quiz_phase() -> List[Dict[str, Any]]:
+        tasks = [asyncio.create_task(_guarded(i, _one_quiz)) for i in range(num_quizzes)]
+        return await _collect(tasks, "quiz", "quiz_id", "quiz_data", quiz_jsonl_path)
+    
+    async def _run_flashcard_phase() -> List[Dict[str, Any]]:
+        tasks = [asyncio.create_task(_guarded(i, _one_flashcard_set)) for i in range(num_flashcard_sets)]
+        return await _collect(
+            tasks, "flashcard set", "flashcard_set_id", "flashcard_data", flashcard_jsonl_path
+        )
+    
+    # Phase 2A + 2B: Generate and evaluate quizzes and flashcards side by side
+    print("📝 Phase 2A/2B: Quiz & Flashcard Generation with LLM Evaluation")
+    print(f"⏳ Generating and evaluating {num_quizzes} quizzes and {num_flashcard_sets} flashcard sets...")
     
-    print("\n✅ Flashcard evaluation completed!")
+    quizzes_task = asyncio.create_task(_run_quiz_phase())
+    cards_task = asyncio.create_task(_run_flashcard_phase())
+    quiz_evaluations, flashcard_evaluations = await asyncio.gather(quizzes_task, cards_task)
+    
+    print("\n✅ Quiz and flashcard evaluation completed!")
     
     # Phase 2C: Manual review framework
     print(f"\n👥 Phase 2C: Manual Review Framework Setup")
     
-    # Select items for manual review (mix of quizzes and flashcards)
+    # Select items for manual review (mix of quizzes and flashcards). Only the
+    # sampled records are read back from the JSONL files with their content.
     manual_review_items = []
     
     # Add quiz items for manual review
     quiz_sample_size = min(manual_review_count // 2, len(quiz_evaluations))
-    for i in range(quiz_sample_size):
+    quiz_sample_ids = {e["quiz_id"] for e in quiz_evaluations[:quiz_sample_size]}
+    quiz_samples = [r for r in _iter_jsonl(quiz_jsonl_path) if r["quiz_id"] in quiz_sample_ids]
+    for record in sorted(quiz_samples, key=lambda r: r["quiz_id"]):
         manual_review_items.append({
             "type": "quiz",
-            "data": quiz_evaluations[i]
+            "data": record
         })
     
     # Add flashcard items for manual review
     flashcard_sample_size = manual_review_count - quiz_sample_size
-    for i in range(min(flashcard_sample_size, len(flashcard_evaluations))):
+    flashcard_sample_ids = {e["flashcard_set_id"] for e in flashcard_evaluations[:flashcard_sample_size]}
+    flashcard_samples = [
+        r for r in _iter_jsonl(flashcard_jsonl_path) if r["flashcard_set_id"] in flashcard_sample_ids
+    ]
+    for record in sorted(flashcard_samples, key=lambda r: r["flashcard_set_id"]):
         manual_review_items.append({
             "type": "flashcard",
-            "data": flashcard_evaluations[i]
+            "data": record
         })
     
     # Generate manual review templates
@@ -705,16 +1160,16 @@ async def run_pedagogical_evaluation(
     print(f"   • Estimated review time: {(len(manual_review_items) * 6)} minutes")
     
     # Compile results
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
     pedagogical_evaluation_results = {
         "evaluation_metadata": {
             "phase": "Phase 2: Simulated Pedagogical Evaluation",
-            "evaluation_date": datetime.utcnow().isoformat(),
+            "evaluation_date": _iso_now(),
             "num_quizzes_evaluated": len(quiz_evaluations),
             "num_flashcard_sets_evaluated": len(flashcard_evaluations),
             "num_manual_review_items": len(manual_review_items),
-            "llm_judge_model": "llama3-groq-70b-8192-tool-use-preview"
+            "llm_judge_model": JUDGE_MODEL,
+            "quiz_records_file": quiz_jsonl_path.name,
+            "flashcard_records_file": flashcard_jsonl_path.name
         },
         "quiz_evaluations": quiz_evaluations,
         "flashcard_evaluations": flashcard_evaluations,
@@ -725,133 +1180,129 @@ async def run_pedagogical_evaluation(
         "rubrics": {
             "quiz_rubric": PedagogicalRubric.QUIZ_RUBRIC,
             "flashcard_rubric": PedagogicalRubric.FLASHCARD_RUBRIC
+        },
+        # Judge score statistics, shared by the summary report and the runner
+        "score_summary": {
+            "quiz": _aggregate_scores(quiz_evaluations, QUIZ_RUBRIC_DIMENSIONS),
+            "flashcard": _aggregate_scores(flashcard_evaluations, FLASHCARD_RUBRIC_DIMENSIONS)
         }
     }
     
-    # Save detailed results
-    with open(results_dir / f"pedagogical_evaluation_{timestamp}.json", "w") as f:
-        json.dump(pedagogical_evaluation_results, f, indent=2)
-    
-    # Save manual review templates separately for easy access
-    with open(results_dir / f"manual_review_quiz_template_{timestamp}.json", "w") as f:
-        json.dump(quiz_review_template, f, indent=2)
-        
-    with open(results_dir / f"manual_review_flashcard_template_{timestamp}.json", "w") as f:
-        json.dump(flashcard_review_template, f, indent=2)
-    
-    # Generate summary report
-    generate_pedagogical_summary_report(pedagogical_evaluation_results, results_dir / f"pedagogical_summary_{timestamp}.txt")
+    # Save detailed results, the manual review templates (separately for easy
+    # access) and the summary report; the files are independent, so they are
+    # written concurrently off the event loop
+    template_files = {
+        "quiz_template": f"manual_review_quiz_template_{timestamp}.json",
+        "flashcard_template": f"manual_review_flashcard_template_{timestamp}.json"
+    }
+    results_bytes, quiz_template_bytes, flashcard_template_bytes = await asyncio.to_thread(
+        _encode_results, pedagogical_evaluation_results, template_files
+    )
+    await asyncio.gather(
+        asyncio.to_thread(
+            _write_gzip, results_dir / f"pedagogical_evaluation_{timestamp}.json.gz", results_bytes
+        ),
+        asyncio.to_thread(
+            (results_dir / template_files["quiz_template"]).write_bytes, quiz_template_bytes
+        ),
+        asyncio.to_thread(
+            (results_dir / template_files["flashcard_template"]).write_bytes, flashcard_template_bytes
+        ),
+        asyncio.to_thread(
+            generate_pedagogical_summary_report,
+            pedagogical_evaluation_results,
+            results_dir / f"pedagogical_summary_{timestamp}.txt"
+        ),
+    )
     
     print(f"\n📁 Results saved to: {results_dir}")
-    print(f"   - Full evaluation: pedagogical_evaluation_{timestamp}.json")
-    print(f"   - Quiz review template: manual_review_quiz_template_{timestamp}.json")
-    print(f"   - Flashcard review template: manual_review_flashcard_template_{timestamp}.json")
+    print(f"   - Full evaluation: pedagogical_evaluation_{timestamp}.json.gz")
+    print(f"   - Quiz records: {quiz_jsonl_path.name}")
+    print(f"   - Flashcard records: {flashcard_jsonl_path.name}")
+    print(f"   - Quiz review template: {template_files['quiz_template']}")
+    print(f"   - Flashcard review template: {template_files['flashcard_template']}")
     print(f"   - Summary report: pedagogical_summary_{timestamp}.txt")
     
     return pedagogical_evaluation_results
 
 
 def generate_pedagogical_summary_report(results: Dict[str, Any], output_path: Path):
-    """Generate human-readable pedagogical evaluation summary."""
+    """Generate human-readable pedagogical evaluation summary.
     
-    with open(output_path, "w") as f:
-        f.write("PEDAGOGICAL EVALUATION SUMMARY REPORT\n")
-        f.write("=" * 45 + "\n\n")
-        
-        metadata = results["evaluation_metadata"]
-        f.write(f"Evaluation Date: {datetime.fromisoformat(metadata['evaluation_date']).strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Phase: {metadata['phase']}\n")
-        f.write(f"LLM Judge Model: {metadata['llm_judge_model']}\n\n")
-        
-        # Quiz evaluation summary
-        f.write("QUIZ EVALUATION SUMMARY\n")
-        f.write("-" * 25 + "\n")
-        
-        quiz_evals = results["quiz_evaluations"]
-        f.write(f"Total Quizzes Evaluated: {len(quiz_evals)}\n")
-        
-        if quiz_evals:
-            # Calculate LLM judge statistics for quizzes
-            successful_quiz_evals = [q for q in quiz_evals if "error" not in q.get("llm_evaluation", {})]
-            f.write(f"Successful LLM Evaluations: {len(successful_quiz_evals)}/{len(quiz_evals)}\n")
-            
-            if successful_quiz_evals:
-                # Extract scores
-                rubric_scores = {}
-                overall_scores = []
-                
-                for eval_data in successful_quiz_evals:
-                    llm_eval = eval_data["llm_evaluation"]
-                    if "overall_score" in llm_eval:
-                        overall_scores.append(float(llm_eval["overall_score"]))
-                    
-                    for rubric_dim in ["correctness", "distractor_quality", "difficulty_appropriateness", "clarity", "pedagogical_value"]:
-                        if rubric_dim in llm_eval and "score" in llm_eval[rubric_dim]:
-                            if rubric_dim not in rubric_scores:
-                                rubric_scores[rubric_dim] = []
-                            rubric_scores[rubric_dim].append(llm_eval[rubric_dim]["score"])
-                
-                if overall_scores:
-                    f.write(f"Average Overall Score: {statistics.mean(overall_scores):.2f}/5.0\n")
-                    f.write(f"Score Range: {min(overall_scores):.1f} - {max(overall_scores):.1f}\n")
-                
-                f.write("\nRubric Dimension Scores:\n")
-                for dim, scores in rubric_scores.items():
-                    if scores:
-                        f.write(f"  {dim.replace('_', ' ').title()}: {statistics.mean(scores):.2f}/5.0 (σ={statistics.stdev(scores):.2f})\n")
-        
-        # Flashcard evaluation summary
-        f.write(f"\nFLASHCARD EVALUATION SUMMARY\n")
-        f.write("-" * 30 + "\n")
+    Scores come from ``results["score_summary"]``, and are computed from the
+    evaluations for results saved without one.
+    """
+    
+    parts = []
+    append = parts.append
+    
+    append("PEDAGOGICAL EVALUATION SUMMARY REPORT\n")
+    append("=" * 45 + "\n\n")
+    
+    metadata = results["evaluation_metadata"]
+    append(f"Evaluation Date: {datetime.fromisoformat(metadata['evaluation_date']).strftime('%Y-%m-%d %H:%M:%S')}\n")
+    append(f"Phase: {metadata['phase']}\n")
+    append(f"LLM Judge Model: {metadata['llm_judge_model']}\n\n")
+    
+    aggregates = results.get("score_summary")
+    if aggregates is None:
+        aggregates = {
+            "quiz": _aggregate_scores(results["quiz_evaluations"], QUIZ_RUBRIC_DIMENSIONS),
+            "flashcard": _aggregate_scores(results["flashcard_evaluations"], FLASHCARD_RUBRIC_DIMENSIONS)
+        }
+    
+    # Quiz and flashcard evaluation summaries
+    for kind, heading, total_label in (
+        ("quiz", "QUIZ EVALUATION SUMMARY", "Total Quizzes Evaluated"),
+        ("flashcard", "FLASHCARD EVALUATION SUMMARY", "Total Flashcard Sets Evaluated"),
+    ):
+        agg = aggregates[kind]
+        if kind != "quiz":
+            append("\n")
+        append(f"{heading}\n")
+        append("-" * (len(heading) + 2) + "\n")
+        append(f"{total_label}: {agg['total']}\n")
         
-        flashcard_evals = results["flashcard_evaluations"]
-        f.write(f"Total Flashcard Sets Evaluated: {len(flashcard_evals)}\n")
+        if not agg["total"]:
+            continue
+        append(f"Successful LLM Evaluations: {agg['successful']}/{agg['total']}\n")
         
-        if flashcard_evals:
-            successful_flashcard_evals = [f for f in flashcard_evals if "error" not in f.get("llm_evaluation", {})]
-            f.write(f"Successful LLM Evaluations: {len(successful_flashcard_evals)}/{len(flashcard_evals)}\n")
+        if agg["successful"]:
+            overall = agg["overall"]
+            if overall["n"]:
+                append(f"Average Overall Score: {overall['mean']:.2f}/5.0\n")
+                append(f"Score Range: {overall['min']:.1f} - {overall['max']:.1f}\n")
             
-            if successful_flashcard_evals:
-                # Extract scores
-                rubric_scores = {}
-                overall_scores = []
-                
-                for eval_data in successful_flashcard_evals:
-                    llm_eval = eval_data["llm_evaluation"]
-                    if "overall_score" in llm_eval:
-                        overall_scores.append(float(llm_eval["overall_score"]))
-                    
-                    for rubric_dim in ["content_accuracy", "cognitive_load", "memorability", "contextual_relevance", "progressive_difficulty"]:
-                        if rubric_dim in llm_eval and "score" in llm_eval[rubric_dim]:
-                            if rubric_dim not in rubric_scores:
-                                rubric_scores[rubric_dim] = []
-                            rubric_scores[rubric_dim].append(llm_eval[rubric_dim]["score"])
-                
-                if overall_scores:
-                    f.write(f"Average Overall Score: {statistics.mean(overall_scores):.2f}/5.0\n")
-                    f.write(f"Score Range: {min(overall_scores):.1f} - {max(overall_scores):.1f}\n")
-                
-                f.write("\nRubric Dimension Scores:\n")
-                for dim, scores in rubric_scores.items():
-                    if scores:
-                        f.write(f"  {dim.replace('_', ' ').title()}: {statistics.mean(scores):.2f}/5.0 (σ={statistics.stdev(scores):.2f})\n")
-        
-        # Manual review information
-        f.write(f"\nMANUAL REVIEW FRAMEWORK\n")
-        f.write("-" * 25 + "\n")
-        
-        quiz_template = results["manual_review_templates"]["quiz_template"]
-        flashcard_template = results["manual_review_templates"]["flashcard_template"]
-        
-        f.write(f"Quiz Items for Manual Review: {len(quiz_template['items_for_review'])}\n")
-        f.write(f"Flashcard Items for Manual Review: {len(flashcard_template['items_for_review'])}\n")
-        f.write(f"Estimated Review Time: {quiz_template['review_metadata']['estimated_time']} + {flashcard_template['review_metadata']['estimated_time']}\n")
-        
-        f.write(f"\nNext Steps for Manual Review:\n")
-        f.write(f"1. Open manual review JSON templates\n")
-        f.write(f"2. Score each item using 1-5 rubric scales\n")
-        f.write(f"3. Add reviewer comments and confidence ratings\n")
-        f.write(f"4. Return completed templates for analysis\n")
+            append("\nRubric Dimension Scores:\n")
+            for dim, scores in agg["by_dim"].items():
+                if scores["n"]:
+                    append(f"  {dim.replace('_', ' ').title()}: {scores['mean']:.2f}/5.0 (σ={scores['std_dev']:.2f})\n")
+    
+    # Manual review information
+    append(f"\nMANUAL REVIEW FRAMEWORK\n")
+    append("-" * 25 + "\n")
+    
+    # Saved results name the template files rather than embedding them
+    templates = {
+        name: template if isinstance(template, dict) else json.loads(
+            (Path(output_path).parent / template).read_text(encoding="utf-8")
+        )
+        for name, template in results["manual_review_templates"].items()
+    }
+    quiz_template = templates["quiz_template"]
+    flashcard_template = templates["flashcard_template"]
+    
+    append(f"Quiz Items for Manual Review: {len(quiz_template['items_for_review'])}\n")
+    append(f"Flashcard Items for Manual Review: {len(flashcard_template['items_for_review'])}\n")
+    append(f"Estimated Review Time: {quiz_template['review_metadata']['estimated_time']} + {flashcard_template['review_metadata']['estimated_time']}\n")
+    
+    append(f"\nNext Steps for Manual Review:\n")
+    append(f"1. Open manual review JSON templates\n")
+    append(f"2. Score each item using 1-5 rubric scales\n")
+    append(f"3. Add reviewer comments and confidence ratings\n")
+    append(f"4. Return completed templates for analysis\n")
+    
+    Path(output_path).write_text("".join(parts), encoding="utf-8")
 
 
 if __name__ == "__main__":
@@ -97,34 +97,12 @@ def main():
         print(f"   • Manual Review Items: {metadata['num_manual_review_items']}")
         print(f"   • LLM Judge Model: {metadata['llm_judge_model']}")
         
-        # Quick quality summary
-        quiz_evals = results['quiz_evaluations']
-        successful_quiz_evals = [q for q in quiz_evals if "error" not in q.get("llm_evaluation", {})]
-        
-        if successful_quiz_evals:
-            overall_scores = []
-            for eval_data in successful_quiz_evals:
-                llm_eval = eval_data["llm_evaluation"]
-                if "overall_score" in llm_eval:
-                    overall_scores.append(float(llm_eval["overall_score"]))
-            
-            if overall_scores:
-                import statistics
-                print(f"   • Quiz Quality Score: {statistics.mean(overall_scores):.1f}/5.0")
-        
-        flashcard_evals = results['flashcard_evaluations']
-        successful_flashcard_evals = [f for f in flashcard_evals if "error" not in f.get("llm_evaluation", {})]
-        
-        if successful_flashcard_evals:
-            overall_scores = []
-            for eval_data in successful_flashcard_evals:
-                llm_eval = eval_data["llm_evaluation"]
-                if "overall_score" in llm_eval:
-                    overall_scores.append(float(llm_eval["overall_score"]))
-            
-            if overall_scores:
-                import statistics
-                print(f"   • Flashcard Quality Score: {statistics.mean(overall_scores):.1f}/5.0")
+        # Quick quality summary, from the scores already aggregated for the report
+        score_summary = results['score_summary']
+        for kind, label in (("quiz", "Quiz"), ("flashcard", "Flashcard")):
+            overall = score_summary[kind]["overall"]
+            if overall["n"]:
+                print(f"   • {label} Quality Score: {overall['mean']:.1f}/5.0")
         
         print(f"\n📁 Results saved in: pedagogical_evaluation_results/")
         print(f"   • Full evaluation data for research analysis")
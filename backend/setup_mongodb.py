@@ -2,9 +2,43 @@
 
 import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
 from app.core.config import get_settings
 
 
+# Indexes per collection, each paired with the description printed once it exists
+COLLECTION_INDEXES = {
+    "users": [
+        (IndexModel("email", unique=True), "unique index on 'email'"),
+        (IndexModel("username", unique=True), "unique index on 'username'"),
+    ],
+    "lessons": [
+        (IndexModel("topic"), "index on 'topic'"),
+        (IndexModel("tailored_to_interest"), "index on 'tailored_to_interest'"),
+        (IndexModel([("created_at", DESCENDING)]), "index on 'created_at' (descending)"),
+        # Text index for full-text search
+        (
+            IndexModel([("topic", TEXT), ("title", TEXT), ("narration_script", TEXT)]),
+            "text index for full-text search"
+        ),
+    ],
+    "user_progress": [
+        (
+            IndexModel([("user_id", ASCENDING), ("lesson_id", ASCENDING)], unique=True),
+            "unique compound index on 'user_id' and 'lesson_id'"
+        ),
+        (
+            IndexModel([("user_id", ASCENDING), ("last_accessed", DESCENDING)]),
+            "compound index on 'user_id' and 'last_accessed'"
+        ),
+        (
+            IndexModel([("lesson_id", ASCENDING), ("status", ASCENDING)]),
+            "compound index on 'lesson_id' and 'status'"
+        ),
+    ],
+}
+
+
 async def setup_mongodb():
     """Create collections and indexes in MongoDB."""
     settings = get_settings()
@@ -21,89 +55,45 @@ async def setup_mongodb():
         await client.admin.command('ping')
         print("✅ Connected to MongoDB\n")
         
-        # Create users collection
-        print("📝 Setting up 'users' collection...")
-        if "users" not in await db.list_collection_names():
-            await db.create_collection("users")
-            print("   ✅ Created 'users' collection")
-        else:
-            print("   ℹ️  'users' collection already exists")
-        
-        # Create indexes for users
-        await db.users.create_index("email", unique=True)
-        print("   ✅ Created unique index on 'email'")
-        
-        await db.users.create_index("username", unique=True)
-        print("   ✅ Created unique index on 'username'")
-        
-        # Create lessons collection
-        print("\n📝 Setting up 'lessons' collection...")
-        if "lessons" not in await db.list_collection_names():
-            await db.create_collection("lessons")
-            print("   ✅ Created 'lessons' collection")
-        else:
-            print("   ℹ️  'lessons' collection already exists")
-        
-        # Create indexes for lessons
-        await db.lessons.create_index("topic")
-        print("   ✅ Created index on 'topic'")
-        
-        await db.lessons.create_index("tailored_to_interest")
-        print("   ✅ Created index on 'tailored_to_interest'")
-        
-        await db.lessons.create_index([("created_at", -1)])
-        print("   ✅ Created index on 'created_at' (descending)")
-        
-        # Create text index for full-text search
-        await db.lessons.create_index([
-            ("topic", "text"),
-            ("title", "text"),
-            ("narration_script", "text")
-        ])
-        print("   ✅ Created text index for full-text search")
-        
-        # Create user_progress collection
-        print("\n📝 Setting up 'user_progress' collection...")
-        if "user_progress" not in await db.list_collection_names():
-            await db.create_collection("user_progress")
-            print("   ✅ Created 'user_progress' collection")
-        else:
-            print("   ℹ️  'user_progress' collection already exists")
-        
-        # Create indexes for user_progress
-        await db.user_progress.create_index(
-            [("user_id", 1), ("lesson_id", 1)],
-            unique=True
-        )
-        print("   ✅ Created unique compound index on 'user_id' and 'lesson_id'")
-        
-        await db.user_progress.create_index([
-            ("user_id", 1),
-            ("last_accessed", -1)
-        ])
-        print("   ✅ Created compound index on 'user_id' and 'last_accessed'")
-        
-        await db.user_progress.create_index([
-            ("lesson_id", 1),
-            ("status", 1)
-        ])
-        print("   ✅ Created compound index on 'lesson_id' and 'status'")
+        # Create collections
+        existing = set(await db.list_collection_names())
+        for collection_name in COLLECTION_INDEXES:
+            print(f"📝 Setting up '{collection_name}' collection...")
+            if collection_name not in existing:
+                await db.create_collection(collection_name)
+                existing.add(collection_name)
+                print(f"   ✅ Created '{collection_name}' collection")
+            else:
+                print(f"   ℹ️  '{collection_name}' collection already exists")
+        
+        # Create each collection's indexes in one round-trip, all collections
+        # at once
+        await asyncio.gather(*(
+            db[collection_name].create_indexes([index for index, _ in indexes])
+            for collection_name, indexes in COLLECTION_INDEXES.items()
+        ))
+        for collection_name, indexes in COLLECTION_INDEXES.items():
+            print(f"\n🔑 Indexes for '{collection_name}':")
+            for _, description in indexes:
+                print(f"   ✅ Created {description}")
         
         # Display collection info
         print("\n📊 Database Summary:")
-        collections = await db.list_collection_names()
+        collections = sorted(existing)
         print(f"   Database: {settings.mongodb_db_name}")
         print(f"   Collections: {', '.join(collections)}\n")
         
         # Display index information
         print("📑 Indexes Created:")
-        for collection_name in ["users", "lessons", "user_progress"]:
-            if collection_name in collections:
-                collection = db[collection_name]
-                indexes = await collection.list_indexes().to_list(length=None)
-                print(f"\n   {collection_name.upper()}:")
-                for idx in indexes:
-                    print(f"      • {idx['name']}: {idx['key']}")
+        summary_collections = [name for name in COLLECTION_INDEXES if name in existing]
+        index_lists = await asyncio.gather(*(
+            db[collection_name].list_indexes().to_list(length=None)
+            for collection_name in summary_collections
+        ))
+        for collection_name, indexes in zip(summary_collections, index_lists):
+            print(f"\n   {collection_name.upper()}:")
+            for idx in indexes:
+                print(f"      • {idx['name']}: {idx['key']}")
         
         print("\n✅ MongoDB setup completed successfully!")
         
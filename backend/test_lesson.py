@@ -4,6 +4,9 @@ import json
 
 BASE_URL = "http://localhost:8000/api/v1"
 
+# One keep-alive session for every request in the script
+SESSION = requests.Session()
+
 def generate_lesson():
     """Generate a test lesson."""
     url = f"{BASE_URL}/lessons/generate"
@@ -14,7 +17,7 @@ def generate_lesson():
     }
     
     print(f"Generating lesson...")
-    response = requests.post(url, json=payload)
+    response = SESSION.post(url, json=payload)
     
     print(f"Status Code: {response.status_code}")
     if response.status_code == 201:
@@ -33,7 +36,7 @@ def list_lessons():
     url = f"{BASE_URL}/lessons/"
     
     print(f"\nFetching lessons...")
-    response = requests.get(url)
+    response = SESSION.get(url)
     
     print(f"Status Code: {response.status_code}")
     if response.status_code == 200:
@@ -5,6 +5,9 @@ from datetime import datetime
 
 BASE_URL = "http://localhost:8000/api/v1"
 
+# One keep-alive session for every request in the script
+SESSION = requests.Session()
+
 def create_test_user():
     """Create a test user if it doesn't exist."""
     # For now, we'll use the test MongoDB script
@@ -22,7 +25,7 @@ def generate_quiz(topic="Python Basics"):
     }
     
     print(f"\n📝 Generating quiz on '{topic}'...")
-    response = requests.post(url, json=payload)
+    response = SESSION.post(url, json=payload)
     
     if response.status_code == 201:
         data = response.json()
@@ -52,7 +55,7 @@ def submit_quiz_perfect_score(quiz_data):
     }
     
     print(f"\n📤 Submitting quiz with PERFECT score (all correct answers)...")
-    response = requests.post(url, json=payload)
+    response = SESSION.post(url, json=payload)
     
     if response.status_code == 200:
         data = response.json()
@@ -86,7 +89,7 @@ def submit_quiz_poor_score(quiz_data):
     }
     
     print(f"\n📤 Submitting quiz with POOR score (all wrong answers)...")
-    response = requests.post(url, json=payload)
+    response = SESSION.post(url, json=payload)
     
     if response.status_code == 200:
         data = response.json()
@@ -125,7 +128,7 @@ def submit_quiz_mixed_score(quiz_data):
     }
     
     print(f"\n📤 Submitting quiz with MIXED score (hard correct, easy/medium wrong)...")
-    response = requests.post(url, json=payload)
+    response = SESSION.post(url, json=payload)
     
     if response.status_code == 200:
         data = response.json()
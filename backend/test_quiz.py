@@ -13,16 +13,12 @@ async def test_quiz_generation():
         "topic_description": "Basic concepts in Python programming including variables, data types, and functions"
     }
     
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(base_url=base_url, timeout=60.0) as client:
         try:
             print("Testing quiz generation endpoint...")
             print(f"Payload: {payload}")
             
-            response = await client.post(
-                f"{base_url}/quizzes/generate",
-                json=payload,
-                timeout=60.0
-            )
+            response = await client.post("/quizzes/generate", json=payload)
             
             print(f"\nStatus Code: {response.status_code}")
             
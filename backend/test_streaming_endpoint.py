@@ -1,13 +1,54 @@
 """Test script to verify streaming audio endpoint."""
 
 import asyncio
+import json
+import logging
 import httpx
 import time
 
-BASE_URL = "http://localhost:8000/api/v1"
+SERVER_URL = "http://localhost:8000"
+BASE_URL = f"{SERVER_URL}/api/v1"
 
+log = logging.getLogger(__name__)
 
-async def test_streaming_endpoint():
+# Request body for the test lesson, serialised once at import time
+LESSON_PAYLOAD = json.dumps({
+    "topic": "Quantum Mechanics",
+    "user_interest": "physics",
+    "proficiency_level": "beginner",
+    "grade_level": "high school"
+}, separators=(",", ":")).encode()
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Upper bound on how much of an error response body is read and shown
+MAX_ERROR_BYTES = 16384
+
+
+def _make_client() -> httpx.AsyncClient:
+    """One keep-alive client shared by every test in the suite."""
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=120.0,
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30),
+    )
+
+
+async def _wait_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    """Poll the API's root status route until the server answers 200."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        try:
+            response = await client.get(f"{SERVER_URL}/", timeout=1.0)
+            if response.status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.25)
+    raise TimeoutError(f"Server at {SERVER_URL} not ready after {timeout:.0f}s")
+
+
+async def test_streaming_endpoint(client: httpx.AsyncClient):
     """Test the /audio/stream endpoint with a real lesson."""
     print("=" * 60)
     print("Testing Streaming Audio Endpoint")
@@ -16,16 +57,11 @@ async def test_streaming_endpoint():
     # Step 1: Generate a lesson first
     print("\n📝 Step 1: Generating a test lesson...")
     
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        response = await client.post(
-            f"{BASE_URL}/lessons/generate",
-            json={
-                "topic": "Quantum Mechanics",
-                "user_interest": "physics",
-                "proficiency_level": "beginner",
-                "grade_level": "high school"
-            }
-        )
+    response = await client.post(
+        "/lessons/generate",
+        content=LESSON_PAYLOAD,
+        headers=JSON_HEADERS,
+    )
     
     if response.status_code != 201:
         print(f"❌ Failed to create lesson: {response.status_code}")
@@ -41,50 +77,63 @@ async def test_streaming_endpoint():
     print(f"\n🎵 Step 2: Streaming audio from lesson...")
     print(f"   Endpoint: GET {BASE_URL}/lessons/{lesson_id}/audio/stream")
     
-    start_time = time.time()
-    first_chunk_time = None
-    chunk_count = 0
-    total_bytes = 0
+    # The receive loop only buffers the audio and records (timestamp, bytes
+    # received so far) per chunk; all output is rendered afterwards so
+    # printing does not skew the timings
+    now_ns = time.monotonic_ns
+    audio = bytearray()
+    extend = audio.extend
+    events = []
+    record = events.append
+    start_ns = now_ns()
     
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            async with client.stream(
-                "GET",
-                f"{BASE_URL}/lessons/{lesson_id}/audio/stream"
-            ) as stream_response:
-                
-                if stream_response.status_code != 200:
-                    print(f"❌ Stream failed: {stream_response.status_code}")
-                    error_text = await stream_response.aread()
-                    print(f"   Error: {error_text.decode()}")
-                    return
-                
-                print(f"✅ Stream started (Status: {stream_response.status_code})")
-                print(f"   Content-Type: {stream_response.headers.get('content-type')}")
-                print(f"\n📊 Receiving audio chunks...")
-                
-                async for chunk in stream_response.aiter_bytes(chunk_size=8192):
-                    chunk_count += 1
-                    total_bytes += len(chunk)
-                    
-                    # Record time of first chunk
-                    if first_chunk_time is None:
-                        first_chunk_time = time.time() - start_time
-                        print(f"\n   🎉 FIRST CHUNK RECEIVED!")
-                        print(f"   ⏱️  Time to first audio: {first_chunk_time:.2f}s")
-                        print(f"   📦 Chunk size: {len(chunk)} bytes")
-                        print(f"   ▶️  Frontend could START PLAYING NOW!")
-                        print(f"\n   Streaming remaining chunks...\n")
-                    
-                    # Progress indicator
-                    if chunk_count % 10 == 0:
-                        elapsed = time.time() - start_time
-                        kb_received = total_bytes / 1024
-                        print(f"   [{elapsed:5.1f}s] Chunk #{chunk_count:3d} | {kb_received:6.1f}KB received")
+        async with client.stream("GET", f"/lessons/{lesson_id}/audio/stream") as stream_response:
+            
+            if stream_response.status_code != 200:
+                print(f"❌ Stream failed: {stream_response.status_code}")
+                # Read only the head of the error body instead of buffering all of it
+                error_body = bytearray()
+                async for part in stream_response.aiter_bytes(4096):
+                    error_body.extend(part)
+                    if len(error_body) >= MAX_ERROR_BYTES:
+                        break
+                error_text = error_body[:MAX_ERROR_BYTES].decode(errors="replace")
+                print(f"   Error: {error_text}")
+                return
+            
+            print(f"✅ Stream started (Status: {stream_response.status_code})")
+            print(f"   Content-Type: {stream_response.headers.get('content-type')}")
+            print(f"\n📊 Receiving audio chunks...")
+            
+            async for chunk in stream_response.aiter_bytes():
+                extend(chunk)
+                record((now_ns(), len(audio)))
         
         # Stream complete
-        total_time = time.time() - start_time
-        kb_total = total_bytes / 1024
+        total_time = (now_ns() - start_ns) / 1e9
+        
+        if not events:
+            print("❌ Stream ended without any audio")
+            return
+        
+        first_chunk_time = (events[0][0] - start_ns) / 1e9
+        print(f"\n   🎉 FIRST CHUNK RECEIVED!")
+        print(f"   ⏱️  Time to first audio: {first_chunk_time:.2f}s")
+        print(f"   📦 Chunk size: {events[0][1]} bytes")
+        print(f"   ▶️  Frontend could START PLAYING NOW!\n")
+        
+        # Progress, every 10th chunk
+        progress = [
+            f"   [{(stamp_ns - start_ns) / 1e9:5.1f}s] Chunk #{chunk_count:3d} | {received / 1024:6.1f}KB received"
+            for chunk_count, (stamp_ns, received) in enumerate(events, 1)
+            if chunk_count % 10 == 0
+        ]
+        if progress:
+            print("\n".join(progress))
+        
+        chunk_count = len(events)
+        kb_total = len(audio) / 1024
         
         print(f"\n✅ Streaming complete!")
         print(f"\n📈 Statistics:")
@@ -100,21 +149,16 @@ async def test_streaming_endpoint():
         print(f"   IMPROVEMENT: {60 / first_chunk_time:.1f}x faster! 🚀")
         
     except Exception as e:
-        print(f"\n❌ Error during streaming: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("\n❌ Error during streaming: %s", e)
 
 
-async def test_missing_lesson():
+async def test_missing_lesson(client: httpx.AsyncClient):
     """Test streaming with non-existent lesson ID."""
     print("\n" + "=" * 60)
     print("Testing Error Handling (Non-existent Lesson)")
     print("=" * 60)
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BASE_URL}/lessons/nonexistent123/audio/stream"
-        )
+    response = await client.get("/lessons/nonexistent123/audio/stream")
     
     print(f"\nStatus: {response.status_code}")
     if response.status_code == 404:
@@ -133,10 +177,18 @@ async def main():
     print("   Run: uvicorn app.main:app --reload")
     print()
     
-    input("Press Enter when server is ready... ")
-    
-    await test_streaming_endpoint()
-    await test_missing_lesson()
+    async with _make_client() as client:
+        print("⏳ Waiting for the server to become ready...")
+        try:
+            await _wait_ready(client)
+        except TimeoutError as e:
+            print(f"❌ {e}")
+            return
+        
+        # Run one after another so the reports do not interleave and the
+        # error requests do not skew the timings
+        await test_streaming_endpoint(client)
+        await test_missing_lesson(client)
     
     print("\n" + "=" * 60)
     print("✅ All tests completed!")
@@ -144,4 +196,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(main())
@@ -16,26 +16,41 @@ async def test_streaming():
     """
     
     lesson_id = "test_streaming_lesson"
-    chunk_count = 0
-    total_bytes = 0
+    # Bounded queue between the TTS stream and the accounting/printing side
+    queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+    audio = bytearray()
+    
+    async def produce():
+        try:
+            async for chunk in generate_audio_stream(test_text.strip(), lesson_id):
+                await queue.put(chunk)
+        finally:
+            # Always release the consumer, even if the stream fails
+            await queue.put(None)
+    
+    async def consume() -> int:
+        chunk_count = 0
+        extend = audio.extend
+        while (chunk := await queue.get()) is not None:
+            chunk_count += 1
+            extend(chunk)
+            
+            # Show progress
+            if chunk_count == 1:
+                print(f"✅ First chunk received! ({len(chunk)} bytes)")
+                print("   → Frontend could start playing audio NOW!")
+            elif chunk_count % 10 == 0:
+                print(f"   Chunk #{chunk_count}: {len(chunk)} bytes (total: {len(audio)/1024:.1f}KB)")
+        return chunk_count
     
     print(f"\n📝 Text to synthesize: {test_text[:100]}...")
     print(f"\n🎤 Starting streaming audio generation...\n")
     
-    async for chunk in generate_audio_stream(test_text.strip(), lesson_id):
-        chunk_count += 1
-        total_bytes += len(chunk)
-        
-        # Show progress
-        if chunk_count == 1:
-            print(f"✅ First chunk received! ({len(chunk)} bytes)")
-            print("   → Frontend could start playing audio NOW!")
-        elif chunk_count % 10 == 0:
-            print(f"   Chunk #{chunk_count}: {len(chunk)} bytes (total: {total_bytes/1024:.1f}KB)")
+    _, chunk_count = await asyncio.gather(produce(), consume())
     
     print(f"\n✅ Streaming complete!")
     print(f"   Total chunks: {chunk_count}")
-    print(f"   Total size: {total_bytes/1024:.1f}KB")
+    print(f"   Total size: {len(audio)/1024:.1f}KB")
     print(f"   Audio saved to: app/static/audio/{lesson_id}.mp3")
     print("\n" + "=" * 60)
     print("Streaming TTS test completed successfully!")
@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+from statistics import fmean
 from app.services.audio_timestamps import extract_word_timestamps, map_timestamps_to_board_actions
 
 async def test_timestamp_extraction():
@@ -17,20 +18,22 @@ async def test_timestamp_extraction():
         print("   Run a lesson generation first to create audio files.")
         return
     
-    # Find the first audio file
-    audio_files = [f for f in os.listdir(audio_dir) if f.endswith('.mp3')]
+    # Collect the audio files along with their stat results
+    with os.scandir(audio_dir) as it:
+        audio_files = [entry for entry in it if entry.name.endswith('.mp3')]
     
     if not audio_files:
         print(f"\n❌ No audio files found in {audio_dir}")
         print("   Run test_streaming_tts.py first to generate a test audio file.")
         return
     
-    # Use the most recent audio file
-    audio_file = audio_files[-1]
-    audio_path = os.path.join(audio_dir, audio_file)
+    # Use the most recently modified audio file
+    newest = max(audio_files, key=lambda entry: entry.stat().st_mtime)
+    audio_file = newest.name
+    audio_path = newest.path
     
     print(f"\n📁 Using audio file: {audio_file}")
-    print(f"   Size: {os.path.getsize(audio_path) / 1024:.1f}KB")
+    print(f"   Size: {newest.stat().st_size / 1024:.1f}KB")
     
     # Extract timestamps
     print(f"\n🎤 Calling Groq Whisper API for timestamp extraction...")
@@ -64,9 +67,9 @@ async def test_timestamp_extraction():
     # Calculate statistics
     print(f"\n📈 Statistics:")
     print("-" * 60)
-    total_duration = timestamps[-1]['end'] if timestamps else 0
+    total_duration = timestamps[-1]['end']
     words_per_second = len(timestamps) / total_duration if total_duration > 0 else 0
-    avg_word_duration = sum(w['end'] - w['start'] for w in timestamps) / len(timestamps)
+    avg_word_duration = fmean(w['end'] - w['start'] for w in timestamps)
     
     print(f"  Total words: {len(timestamps)}")
     print(f"  Total duration: {total_duration:.1f}s")
@@ -1,13 +1,52 @@
 """Test script to verify the word timestamps endpoint."""
 
 import asyncio
+import json
+import logging
 import httpx
 import time
+from statistics import fmean
 
-BASE_URL = "http://localhost:8000/api/v1"
+SERVER_URL = "http://localhost:8000"
+BASE_URL = f"{SERVER_URL}/api/v1"
 
+log = logging.getLogger(__name__)
 
-async def test_timestamps_endpoint():
+# Request body for the test lesson, serialised once at import time
+LESSON_PAYLOAD = json.dumps({
+    "topic": "Cellular Respiration",
+    "user_interest": "biology",
+    "proficiency_level": "intermediate",
+    "grade_level": "high school"
+}, separators=(",", ":")).encode()
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _make_client() -> httpx.AsyncClient:
+    """One keep-alive client shared by every test in the suite."""
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=120.0,
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30),
+    )
+
+
+async def _wait_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    """Poll the API's root status route until the server answers 200."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        try:
+            response = await client.get(f"{SERVER_URL}/", timeout=1.0)
+            if response.status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.25)
+    raise TimeoutError(f"Server at {SERVER_URL} not ready after {timeout:.0f}s")
+
+
+async def test_timestamps_endpoint(client: httpx.AsyncClient):
     """Test the /timestamps endpoint with a real lesson."""
     print("=" * 70)
     print("Testing Word Timestamps Endpoint (Groq Whisper)")
@@ -16,16 +55,11 @@ async def test_timestamps_endpoint():
     # Step 1: Generate a lesson
     print("\n📝 Step 1: Generating a test lesson...")
     
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        response = await client.post(
-            f"{BASE_URL}/lessons/generate",
-            json={
-                "topic": "Cellular Respiration",
-                "user_interest": "biology",
-                "proficiency_level": "intermediate",
-                "grade_level": "high school"
-            }
-        )
+    response = await client.post(
+        "/lessons/generate",
+        content=LESSON_PAYLOAD,
+        headers=JSON_HEADERS,
+    )
     
     if response.status_code != 201:
         print(f"❌ Failed to create lesson: {response.status_code}")
@@ -46,10 +80,7 @@ async def test_timestamps_endpoint():
     start_time = time.time()
     
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.get(
-                f"{BASE_URL}/lessons/{lesson_id}/timestamps"
-            )
+        response = await client.get(f"/lessons/{lesson_id}/timestamps")
         
         elapsed = time.time() - start_time
         
@@ -96,9 +127,9 @@ async def test_timestamps_endpoint():
         print(f"\n📈 Statistics:")
         print("-" * 70)
         words_per_second = data['word_count'] / data['duration']
-        avg_word_duration = sum(
-            w['end'] - w['start'] for w in word_timestamps
-        ) / len(word_timestamps)
+        avg_word_duration = (
+            fmean(w['end'] - w['start'] for w in word_timestamps) if word_timestamps else 0.0
+        )
         
         print(f"   Total words: {data['word_count']}")
         print(f"   Total duration: {data['duration']:.1f}s")
@@ -162,12 +193,10 @@ async def test_timestamps_endpoint():
         print("=" * 70)
         
     except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("\n❌ Error: %s", e)
 
 
-async def test_error_cases():
+async def test_error_cases(client: httpx.AsyncClient):
     """Test error handling."""
     print("\n" + "=" * 70)
     print("Testing Error Handling")
@@ -175,10 +204,7 @@ async def test_error_cases():
     
     # Test 1: Non-existent lesson
     print("\n🧪 Test 1: Non-existent lesson")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{BASE_URL}/lessons/nonexistent123/timestamps"
-        )
+    response = await client.get("/lessons/nonexistent123/timestamps")
     print(f"   Status: {response.status_code}")
     print(f"   ✅ Correctly returns 404" if response.status_code == 404 else f"   ⚠️  Expected 404")
     
@@ -197,10 +223,18 @@ async def main():
     print("   Run: uvicorn app.main:app --reload")
     print()
     
-    input("Press Enter when server is ready... ")
-    
-    await test_timestamps_endpoint()
-    await test_error_cases()
+    async with _make_client() as client:
+        print("⏳ Waiting for the server to become ready...")
+        try:
+            await _wait_ready(client)
+        except TimeoutError as e:
+            print(f"❌ {e}")
+            return
+        
+        # Run one after another so the reports do not interleave and the
+        # error requests do not skew the timings
+        await test_timestamps_endpoint(client)
+        await test_error_cases(client)
     
     print("\n" + "=" * 70)
     print("✅ All tests completed!")
@@ -213,4 +247,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(main())
@@ -1,17 +1,28 @@
 """View user proficiency from MongoDB."""
 import asyncio
+import atexit
+import sys
 from motor.motor_asyncio import AsyncIOMotorClient
 
 MONGODB_URI = "mongodb://localhost:27017"
 DATABASE_NAME = "ConceptPilot"
 
+# Shared client with a small pool; a one-shot report never needs more
+_CLIENT = AsyncIOMotorClient(MONGODB_URI, maxPoolSize=5, serverSelectionTimeoutMS=2000)
+atexit.register(_CLIENT.close)
+
+# Only the fields the report renders are fetched from the server
+USER_PROJECTION = {"_id": 1, "username": 1, "email": 1, "topic_proficiency": 1}
+
+# Progress bars for every possible fill length, indexed by int(score * 50)
+_BARS = tuple("█" * i + "░" * (50 - i) for i in range(51))
+
 async def view_proficiency():
     """View current proficiency for test user."""
-    client = AsyncIOMotorClient(MONGODB_URI)
-    db = client[DATABASE_NAME]
+    db = _CLIENT[DATABASE_NAME]
     users_collection = db["users"]
     
-    user = await users_collection.find_one({"_id": "user123"})
+    user = await users_collection.find_one({"_id": "user123"}, USER_PROJECTION)
     
     if user:
         print("📊 User Proficiency Report")
@@ -23,21 +34,21 @@ async def view_proficiency():
         print("=" * 60)
         proficiency = user.get("topic_proficiency", {})
         if proficiency:
+            lines = []
             for topic, score in sorted(proficiency.items()):
-                percentage = score * 100
-                # Create visual bar
-                bar_length = int(score * 50)
-                bar = "█" * bar_length + "░" * (50 - bar_length)
-                print(f"\n{topic}:")
-                print(f"  Score: {score:.4f} ({percentage:.1f}%)")
-                print(f"  [{bar}]")
+                bar = _BARS[int(score * 50)]
+                lines.append(
+                    f"\n{topic}:\n"
+                    f"  Score: {score:.4f} ({score * 100:.1f}%)\n"
+                    f"  [{bar}]\n"
+                )
+            # Emit the whole table with a single write
+            sys.stdout.write("".join(lines))
         else:
             print("  ⚠️  No proficiency data yet")
         print("\n" + "=" * 60)
     else:
         print("❌ User not found")
-    
-    client.close()
 
 if __name__ == "__main__":
     asyncio.run(view_proficiency())